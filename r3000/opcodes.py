@@ -1,19 +1,18 @@
 import abc
-import ctypes
-import typing
-from collections.abc import Callable
-import dataclasses
-from typing import ClassVar
+import array
+from collections.abc import Callable, Iterable
+from typing import Any, ClassVar, NamedTuple, Protocol, cast
 from r3000 import registers
 from r3000.registers import Register, ExecutionContext
 
 
 EncodedInstruction = int
 OpcodeDecoder = Callable[[EncodedInstruction], 'Instruction']
+_NONE_STRING = 'None'
+_ZERO_IMM_STRING = '0x0'
 
 
-@dataclasses.dataclass
-class OpcodeArgs:
+class OpcodeArgs(NamedTuple):
     rs: Register | None = None
     rt: Register | None = None
     rd: Register | None = None
@@ -23,45 +22,60 @@ class OpcodeArgs:
         return f'rs={self.rs}, rt={self.rt}, rd={self.rd}, imm={self._imm_to_string()}'
 
     def _imm_to_string(self) -> str:
-        return f'{self.imm:X}' if self.imm is not None else f'{None}'
+        return f'{self.imm:X}' if self.imm is not None else _NONE_STRING
+
+
+class _DecodedOpcodeArgs(Protocol):
+    @property
+    def rs(self) -> Register: ...
+
+    @property
+    def rt(self) -> Register: ...
+
+    @property
+    def rd(self) -> Register: ...
+
+    @property
+    def imm(self) -> int: ...
 
 
 class Helpers:
     @staticmethod
     def decode_rs(encoded: EncodedInstruction) -> Register:
-        return registers.cpu_by_index[(encoded & 0x3e00000) >> 21]
+        return registers.cpu_by_index[(encoded >> 21) & 0x1f]
 
     @staticmethod
     def encode_rs(args: OpcodeArgs) -> int:
-        return args.rs.index << 21
+        return cast(_DecodedOpcodeArgs, args).rs.index << 21
 
     @staticmethod
     def decode_rt(encoded: EncodedInstruction) -> Register:
-        return registers.cpu_by_index[Helpers.decode_rt_index(encoded)]
+        return registers.cpu_by_index[(encoded >> 16) & 0x1f]
 
     @staticmethod
     def decode_rt_index(encoded: EncodedInstruction) -> int:
-        return (encoded & 0x1f0000) >> 16
+        return (encoded >> 16) & 0x1f
 
     @staticmethod
     def encode_rt(args: OpcodeArgs) -> int:
-        return args.rt.index << 16
+        return cast(_DecodedOpcodeArgs, args).rt.index << 16
 
     @staticmethod
     def decode_rd(encoded: EncodedInstruction) -> Register:
-        return registers.cpu_by_index[Helpers.decode_rd_index(encoded)]
+        return registers.cpu_by_index[(encoded >> 11) & 0x1f]
 
     @staticmethod
     def decode_rd_index(encoded: EncodedInstruction) -> int:
-        return (encoded & 0xf800) >> 11
+        return (encoded >> 11) & 0x1f
 
     @staticmethod
     def encode_rd(args: OpcodeArgs) -> int:
-        return args.rd.index << 11
+        return cast(_DecodedOpcodeArgs, args).rd.index << 11
 
     @staticmethod
     def decode_s_imm16(encoded: EncodedInstruction) -> int:
-        return ctypes.c_int16(encoded).value
+        imm = encoded & 0xffff
+        return imm - 0x10000 if imm >= 0x8000 else imm
 
     @staticmethod
     def decode_u_imm16(encoded: EncodedInstruction) -> int:
@@ -69,7 +83,7 @@ class Helpers:
 
     @staticmethod
     def encode_imm16(args: OpcodeArgs) -> int:
-        return ctypes.c_uint16(args.imm).value
+        return cast(_DecodedOpcodeArgs, args).imm & 0xffff
 
     @staticmethod
     def branch_address_string(context: ExecutionContext, args: OpcodeArgs) -> str:
@@ -77,70 +91,104 @@ class Helpers:
 
     @staticmethod
     def branch_address(context: ExecutionContext, args: OpcodeArgs) -> int:
-        return context.pc.value + 4 + args.imm * 4
+        return context.pc.value + 4 + cast(_DecodedOpcodeArgs, args).imm * 4
 
     @staticmethod
     def signed_imm_string(args: OpcodeArgs) -> str:
-        return f'0x{args.imm:X}' if args.imm >= 0 else f'-0x{-args.imm:X}'
+        imm = cast(_DecodedOpcodeArgs, args).imm
+        if imm > 0:
+            return f'0x{imm:X}'
+        if imm < 0:
+            return f'-0x{-imm:X}'
+        return _ZERO_IMM_STRING
 
     @staticmethod
     def unsigned_imm_string(args: OpcodeArgs) -> str:
         return f'0x{args.imm:X}'
 
 
-@dataclasses.dataclass
+def _compile_args_decoder(
+        opcode_class: type['Opcode'],
+        name: str,
+        parameters: str,
+        result_format: str,
+        **namespace: Any) -> Callable[..., Any]:
+    namespace.update(
+        _new=tuple.__new__,
+        _args=OpcodeArgs,
+        _cpu=registers.cpu_by_index,
+        _cop_registers=opcode_class.COP_REGISTERS)
+    args = f'_new(_args, ({opcode_class.ARGS_DECODER_SOURCE}))'
+    exec(f'def {name}({parameters}):\n    return {result_format.format(args=args)}', namespace)
+    return namespace[name]
+
+
 class Opcode(abc.ABC):
-    name: str
-    primary_opcode: int
-    args_number: int
+    ARGS_DECODER_SOURCE: ClassVar[str | None] = None
+    COP_REGISTERS: ClassVar[list[Register] | None] = None
+    IS_VALID: ClassVar[bool] = True
+    args_number: ClassVar[int]
+    decode_args: Callable[[EncodedInstruction], OpcodeArgs]
+    __slots__ = ('name', 'primary_opcode', 'mnemonic_prefix', '_encoded_base')
+
+    def __init__(self, name: str, primary_opcode: int):
+        self.name = name
+        self.primary_opcode = primary_opcode
+        self.mnemonic_prefix = name + ' '
+        self._encoded_base: EncodedInstruction | None = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if cls.ARGS_DECODER_SOURCE is None or 'decode_args' in cls.__dict__:
+            return
+        setattr(cls, 'decode_args', classmethod(_compile_args_decoder(cls, 'decode_args', 'cls, e', '{args}')))
 
     def to_string(self, context: ExecutionContext, args: OpcodeArgs) -> str:
         args_string = self.args_to_string(context, args)
         if args_string is None:
             return ''
-        return f'{self.name} {args_string}' if len(args_string) > 0 else self.name
+        return self.mnemonic_prefix + args_string if args_string else self.name
 
     def encode(self, args: OpcodeArgs) -> EncodedInstruction:
-        return (self.primary_opcode << 26) | self.encode_args(args)
+        encoded_base = self._encoded_base
+        if encoded_base is None:
+            encoded_base = self._encoded_base = self.encode_base()
+        return encoded_base | self.encode_args(args)
+
+    def encode_base(self) -> EncodedInstruction:
+        return self.primary_opcode << 26
 
     @staticmethod
-    def decode_primary(encoded) -> int:
-        return (encoded & 0xfc000000) >> 26
+    def decode_primary(encoded: EncodedInstruction) -> int:
+        return (encoded >> 26) & 0x3f
 
     @classmethod
     @abc.abstractmethod
     def args_to_string(cls, context: ExecutionContext, args: OpcodeArgs) -> str: ...
 
-    @classmethod
-    @abc.abstractmethod
-    def decode_args(cls, encoded: EncodedInstruction) -> OpcodeArgs: ...
-
     @classmethod
     @abc.abstractmethod
     def encode_args(cls, args: OpcodeArgs) -> int: ...
 
 
-def _primary_opcode_mixin(primary: int):
-    @dataclasses.dataclass
+def _primary_opcode_mixin(primary: int) -> type:
     class _PrimaryOpcodeMixin:
         PRIMARY_OPCODE: ClassVar[int] = primary
-        primary_opcode: int = dataclasses.field(init=False, default=PRIMARY_OPCODE)
 
     return _PrimaryOpcodeMixin
 
 
-@dataclasses.dataclass
 class InvalidOpcode(Opcode):
-    name: str = dataclasses.field(init=False, default='invalid')
-    primary_opcode: int = dataclasses.field(init=False, default=0)
-    args_number: int = dataclasses.field(init=False, default=0)
-    encoded: EncodedInstruction
-    cause: str
+    IS_VALID = False
+    args_number = 0
+    __slots__ = ('encoded', 'cause')
 
-    def __post_init__(self):
-        self.primary_opcode = self.decode_primary(self.encoded)
+    def __init__(self, encoded: EncodedInstruction, cause: str):
+        super().__init__('invalid', self.decode_primary(encoded))
+        self.encoded = encoded
+        self.cause = cause
 
-    def encode(self, args: OpcodeArgs = None) -> EncodedInstruction:
+    def encode(self, args: OpcodeArgs | None = None) -> EncodedInstruction:
         return self.encoded
 
     @classmethod
@@ -156,27 +204,25 @@ class InvalidOpcode(Opcode):
         return 0
 
 
-@dataclasses.dataclass
 class _OneArgMixin:
-    args_number: int = dataclasses.field(init=False, default=1)
+    args_number = 1
 
 
-@dataclasses.dataclass
 class _TwoArgsMixin:
-    args_number: int = dataclasses.field(init=False, default=2)
+    args_number = 2
 
 
-@dataclasses.dataclass
 class _ThreeArgsMixin:
-    args_number: int = dataclasses.field(init=False, default=3)
+    args_number = 3
 
 
-@dataclasses.dataclass
 class SecondaryOpcode(_primary_opcode_mixin(0x00), Opcode, abc.ABC):
-    secondary_opcode: int
+    def __init__(self, name: str, secondary_opcode: int):
+        super().__init__(name, self.PRIMARY_OPCODE)
+        self.secondary_opcode = secondary_opcode
 
-    def encode(self, args: OpcodeArgs) -> EncodedInstruction:
-        return super().encode(args) | self.encode_secondary()
+    def encode_base(self) -> EncodedInstruction:
+        return super().encode_base() | self.encode_secondary()
 
     @classmethod
     def decode_secondary(cls, encoded: EncodedInstruction) -> int:
@@ -193,390 +239,341 @@ class _RsRtImm16EncoderMixin(_ThreeArgsMixin):
 
 
 class _RsRtImmS16CoderMixin(_RsRtImm16EncoderMixin):
-    @classmethod
-    def decode_args(cls, encoded: EncodedInstruction) -> OpcodeArgs:
-        return OpcodeArgs(
-            rs=Helpers.decode_rs(encoded),
-            rt=Helpers.decode_rt(encoded),
-            imm=Helpers.decode_s_imm16(encoded))
+    ARGS_DECODER_SOURCE: ClassVar[str | None] = (
+        '_cpu[(e >> 21) & 0x1f], _cpu[(e >> 16) & 0x1f], None, ((e & 0xffff) ^ 0x8000) - 0x8000')
 
 
 class _RsRtImmU16CoderMixin(_RsRtImm16EncoderMixin):
-    @classmethod
-    def decode_args(cls, encoded: EncodedInstruction) -> OpcodeArgs:
-        return OpcodeArgs(
-            rs=Helpers.decode_rs(encoded),
-            rt=Helpers.decode_rt(encoded),
-            imm=Helpers.decode_u_imm16(encoded))
+    ARGS_DECODER_SOURCE: ClassVar[str | None] = '_cpu[(e >> 21) & 0x1f], _cpu[(e >> 16) & 0x1f], None, e & 0xffff'
 
 
 class _LoadStoreArgsConverterMixin:
     @classmethod
     def args_to_string(cls, _context: ExecutionContext, args: OpcodeArgs) -> str:
-        return f'{args.rt}, {Helpers.signed_imm_string(args)}({args.rs})'
+        decoded_args = cast(_DecodedOpcodeArgs, args)
+        return f'{decoded_args.rt.display}, {Helpers.signed_imm_string(args)}({decoded_args.rs.display})'
 
 
-@dataclasses.dataclass
 class _ShiftImmOpcode(_ThreeArgsMixin, SecondaryOpcode):
-    @classmethod
-    def args_to_string(cls, context: ExecutionContext, args: OpcodeArgs) -> str:
-        return f'{args.rd}, {args.rt}, {Helpers.unsigned_imm_string(args)}'
+    ARGS_DECODER_SOURCE = 'None, _cpu[(e >> 16) & 0x1f], _cpu[(e >> 11) & 0x1f], (e >> 6) & 0x1f'
 
     @classmethod
-    def decode_args(cls, encoded: EncodedInstruction) -> OpcodeArgs:
-        return OpcodeArgs(rt=Helpers.decode_rt(encoded), rd=Helpers.decode_rd(encoded), imm=(encoded & 0x7c0) >> 6)
+    def args_to_string(cls, context: ExecutionContext, args: OpcodeArgs) -> str:
+        decoded_args = cast(_DecodedOpcodeArgs, args)
+        return f'{decoded_args.rd.display}, {decoded_args.rt.display}, {Helpers.unsigned_imm_string(args)}'
 
     @classmethod
     def encode_args(cls, args: OpcodeArgs) -> int:
-        return Helpers.encode_rt(args) | Helpers.encode_rd(args) | (args.imm << 6)
+        return Helpers.encode_rt(args) | Helpers.encode_rd(args) | (cast(_DecodedOpcodeArgs, args).imm << 6)
 
 
 class _RsRtRdCoderMixin(_ThreeArgsMixin):
-    @classmethod
-    def decode_args(cls, encoded: EncodedInstruction) -> OpcodeArgs:
-        return OpcodeArgs(rs=Helpers.decode_rs(encoded), rt=Helpers.decode_rt(encoded), rd=Helpers.decode_rd(encoded))
+    ARGS_DECODER_SOURCE: ClassVar[str | None] = (
+        '_cpu[(e >> 21) & 0x1f], _cpu[(e >> 16) & 0x1f], _cpu[(e >> 11) & 0x1f], None')
 
     @classmethod
     def encode_args(cls, args: OpcodeArgs) -> int:
         return Helpers.encode_rs(args) | Helpers.encode_rt(args) | Helpers.encode_rd(args)
 
 
-@dataclasses.dataclass
 class _RsRtRdOpcode(_RsRtRdCoderMixin, SecondaryOpcode, abc.ABC):
     pass
 
 
-@dataclasses.dataclass
 class _ShiftRegOpcode(_RsRtRdOpcode):
     @classmethod
     def args_to_string(cls, context: ExecutionContext, args: OpcodeArgs) -> str:
-        return f'{args.rd}, {args.rt}, {args.rs}'
+        decoded_args = cast(_DecodedOpcodeArgs, args)
+        return f'{decoded_args.rd.display}, {decoded_args.rt.display}, {decoded_args.rs.display}'
 
 
-@dataclasses.dataclass
 class _JrOpcode(_OneArgMixin, SecondaryOpcode):
-    @classmethod
-    def args_to_string(cls, context: ExecutionContext, args: OpcodeArgs) -> str:
-        return str(args.rs)
+    ARGS_DECODER_SOURCE = '_cpu[(e >> 21) & 0x1f], None, None, None'
 
     @classmethod
-    def decode_args(cls, encoded: EncodedInstruction) -> OpcodeArgs:
-        return OpcodeArgs(rs=Helpers.decode_rs(encoded))
+    def args_to_string(cls, context: ExecutionContext, args: OpcodeArgs) -> str:
+        return cast(_DecodedOpcodeArgs, args).rs.display
 
     @classmethod
     def encode_args(cls, args: OpcodeArgs) -> int:
         return Helpers.encode_rs(args)
 
 
-@dataclasses.dataclass
 class _JalrOpcode(_TwoArgsMixin, SecondaryOpcode):
-    @classmethod
-    def args_to_string(cls, context: ExecutionContext, args: OpcodeArgs) -> str:
-        return f'{args.rs}' if args.rd is registers.ra else f'{args.rs}, {args.rd}'
+    ARGS_DECODER_SOURCE = '_cpu[(e >> 21) & 0x1f], None, _cpu[(e >> 11) & 0x1f], None'
 
     @classmethod
-    def decode_args(cls, encoded: EncodedInstruction) -> OpcodeArgs:
-        return OpcodeArgs(rs=Helpers.decode_rs(encoded), rd=Helpers.decode_rd(encoded))
+    def args_to_string(cls, context: ExecutionContext, args: OpcodeArgs) -> str:
+        decoded_args = cast(_DecodedOpcodeArgs, args)
+        if decoded_args.rd is registers.ra:
+            return decoded_args.rs.display
+        return f'{decoded_args.rs.display}, {decoded_args.rd.display}'
 
     @classmethod
     def encode_args(cls, args: OpcodeArgs) -> int:
         return Helpers.encode_rs(args) | Helpers.encode_rd(args)
 
 
-@dataclasses.dataclass
 class _ExceptionOpcode(_OneArgMixin, SecondaryOpcode):
+    ARGS_DECODER_SOURCE = 'None, None, None, (e >> 6) & 0xfffff'
+
     @classmethod
     def args_to_string(cls, context: ExecutionContext, args: OpcodeArgs) -> str:
         return Helpers.unsigned_imm_string(args) if args.imm != 0 else ''
 
-    @classmethod
-    def decode_args(cls, encoded: EncodedInstruction) -> OpcodeArgs:
-        return OpcodeArgs(imm=(encoded & 0x3ffffc0) >> 6)
-
     @classmethod
     def encode_args(cls, args: OpcodeArgs) -> int:
-        return args.imm << 6
+        return cast(_DecodedOpcodeArgs, args).imm << 6
 
 
-@dataclasses.dataclass
 class _MfOpcode(_OneArgMixin, SecondaryOpcode):
-    @classmethod
-    def args_to_string(cls, context: ExecutionContext, args: OpcodeArgs) -> str:
-        return str(args.rd)
+    ARGS_DECODER_SOURCE = 'None, None, _cpu[(e >> 11) & 0x1f], None'
 
     @classmethod
-    def decode_args(cls, encoded: EncodedInstruction) -> OpcodeArgs:
-        return OpcodeArgs(rd=Helpers.decode_rd(encoded))
+    def args_to_string(cls, context: ExecutionContext, args: OpcodeArgs) -> str:
+        return cast(_DecodedOpcodeArgs, args).rd.display
 
     @classmethod
     def encode_args(cls, args: OpcodeArgs) -> int:
         return Helpers.encode_rd(args)
 
 
-@dataclasses.dataclass
 class _MtOpcode(_OneArgMixin, SecondaryOpcode):
-    @classmethod
-    def args_to_string(cls, context: ExecutionContext, args: OpcodeArgs) -> str:
-        return str(args.rs)
+    ARGS_DECODER_SOURCE = '_cpu[(e >> 21) & 0x1f], None, None, None'
 
     @classmethod
-    def decode_args(cls, encoded: EncodedInstruction) -> OpcodeArgs:
-        return OpcodeArgs(rs=Helpers.decode_rs(encoded))
+    def args_to_string(cls, context: ExecutionContext, args: OpcodeArgs) -> str:
+        return cast(_DecodedOpcodeArgs, args).rs.display
 
     @classmethod
     def encode_args(cls, args: OpcodeArgs) -> int:
         return Helpers.encode_rs(args)
 
 
-@dataclasses.dataclass
 class _MulDivOpcode(_TwoArgsMixin, SecondaryOpcode):
-    @classmethod
-    def args_to_string(cls, context: ExecutionContext, args: OpcodeArgs) -> str:
-        return f'{args.rs}, {args.rt}'
+    ARGS_DECODER_SOURCE = '_cpu[(e >> 21) & 0x1f], _cpu[(e >> 16) & 0x1f], None, None'
 
     @classmethod
-    def decode_args(cls, encoded: EncodedInstruction) -> OpcodeArgs:
-        return OpcodeArgs(rs=Helpers.decode_rs(encoded), rt=Helpers.decode_rt(encoded))
+    def args_to_string(cls, context: ExecutionContext, args: OpcodeArgs) -> str:
+        decoded_args = cast(_DecodedOpcodeArgs, args)
+        return f'{decoded_args.rs.display}, {decoded_args.rt.display}'
 
     @classmethod
     def encode_args(cls, args: OpcodeArgs) -> int:
         return Helpers.encode_rs(args) | Helpers.encode_rt(args)
 
 
-@dataclasses.dataclass
 class _AluRegOpcode(_RsRtRdOpcode):
     @classmethod
     def args_to_string(cls, context: ExecutionContext, args: OpcodeArgs) -> str:
-        return f'{args.rd}, {args.rs}, {args.rt}'
+        decoded_args = cast(_DecodedOpcodeArgs, args)
+        return f'{decoded_args.rd.display}, {decoded_args.rs.display}, {decoded_args.rt.display}'
 
 
-@dataclasses.dataclass
 class _JumpImmediateOpcode(_OneArgMixin, Opcode):
-    @classmethod
-    def args_to_string(cls, context: ExecutionContext, args: OpcodeArgs) -> str:
-        return f'0x{(context.pc.value & 0xf0000000) + args.imm * 4:08X}'
+    ARGS_DECODER_SOURCE = 'None, None, None, e & 0x3ffffff'
 
     @classmethod
-    def decode_args(cls, encoded: EncodedInstruction) -> OpcodeArgs:
-        return OpcodeArgs(imm=encoded & 0x3ffffff)
+    def args_to_string(cls, context: ExecutionContext, args: OpcodeArgs) -> str:
+        return f'0x{(context.pc.value & 0xf0000000) + cast(_DecodedOpcodeArgs, args).imm * 4:08X}'
 
     @classmethod
     def encode_args(cls, args: OpcodeArgs) -> int:
-        return args.imm
+        return cast(_DecodedOpcodeArgs, args).imm
 
 
-@dataclasses.dataclass
 class _BranchZeroConditionOpcode(_TwoArgsMixin, Opcode):
-    @classmethod
-    def args_to_string(cls, context: ExecutionContext, args: OpcodeArgs) -> str:
-        return f'{args.rs}, {Helpers.branch_address_string(context, args)}'
+    ARGS_DECODER_SOURCE = '_cpu[(e >> 21) & 0x1f], None, None, ((e & 0xffff) ^ 0x8000) - 0x8000'
 
     @classmethod
-    def decode_args(cls, encoded: EncodedInstruction) -> OpcodeArgs:
-        return OpcodeArgs(rs=Helpers.decode_rs(encoded), imm=Helpers.decode_s_imm16(encoded))
+    def args_to_string(cls, context: ExecutionContext, args: OpcodeArgs) -> str:
+        return f'{cast(_DecodedOpcodeArgs, args).rs.display}, {Helpers.branch_address_string(context, args)}'
 
     @classmethod
     def encode_args(cls, args: OpcodeArgs) -> int:
         return Helpers.encode_rs(args) | Helpers.encode_imm16(args)
 
 
-@dataclasses.dataclass
 class BranchZeroConditionWithDiscriminatorOpcode(_primary_opcode_mixin(0x01), _BranchZeroConditionOpcode):
-    discriminator: int
+    def __init__(self, name: str, discriminator: int):
+        super().__init__(name, self.PRIMARY_OPCODE)
+        self.discriminator = discriminator
 
-    def encode(self, args: OpcodeArgs) -> int:
-        return super().encode(args) | (self.discriminator << 16)
+    def encode_base(self) -> EncodedInstruction:
+        return super().encode_base() | (self.discriminator << 16)
 
     @classmethod
     def decode_discriminator(cls, encoded: EncodedInstruction) -> int:
-        return (encoded & 0x1f0000) >> 16
+        return (encoded >> 16) & 0x1f
 
 
-@dataclasses.dataclass
 class _BranchNonZeroConditionOpcode(_RsRtImmS16CoderMixin, Opcode):
     @classmethod
     def args_to_string(cls, context: ExecutionContext, args: OpcodeArgs) -> str:
-        return f'{args.rs}, {args.rt}, {Helpers.branch_address_string(context, args)}'
+        decoded_args = cast(_DecodedOpcodeArgs, args)
+        return f'{decoded_args.rs.display}, {decoded_args.rt.display}, {Helpers.branch_address_string(context, args)}'
 
 
-@dataclasses.dataclass
 class _AluSignedImmOpcode(_RsRtImmS16CoderMixin, Opcode):
     @classmethod
     def args_to_string(cls, context: ExecutionContext, args: OpcodeArgs) -> str:
-        return f'{args.rt}, {args.rs}, {Helpers.signed_imm_string(args)}'
+        decoded_args = cast(_DecodedOpcodeArgs, args)
+        return f'{decoded_args.rt.display}, {decoded_args.rs.display}, {Helpers.signed_imm_string(args)}'
 
 
-@dataclasses.dataclass
 class _AluUnsignedImmOpcode(_RsRtImmU16CoderMixin, Opcode):
     @classmethod
     def args_to_string(cls, context: ExecutionContext, args: OpcodeArgs) -> str:
-        return f'{args.rt}, {args.rs}, {Helpers.unsigned_imm_string(args)}'
+        decoded_args = cast(_DecodedOpcodeArgs, args)
+        return f'{decoded_args.rt.display}, {decoded_args.rs.display}, {Helpers.unsigned_imm_string(args)}'
 
 
-@dataclasses.dataclass
 class _LuiOpcode(_TwoArgsMixin, Opcode):
-    @classmethod
-    def args_to_string(cls, context: ExecutionContext, args: OpcodeArgs) -> str:
-        return f'{args.rt}, {Helpers.unsigned_imm_string(args)}'
+    ARGS_DECODER_SOURCE = 'None, _cpu[(e >> 16) & 0x1f], None, e & 0xffff'
 
     @classmethod
-    def decode_args(cls, encoded: EncodedInstruction) -> OpcodeArgs:
-        return OpcodeArgs(rt=Helpers.decode_rt(encoded), imm=Helpers.decode_u_imm16(encoded))
+    def args_to_string(cls, context: ExecutionContext, args: OpcodeArgs) -> str:
+        return f'{cast(_DecodedOpcodeArgs, args).rt.display}, {Helpers.unsigned_imm_string(args)}'
 
     @classmethod
     def encode_args(cls, args: OpcodeArgs) -> int:
         return Helpers.encode_rt(args) | Helpers.encode_imm16(args)
 
 
-@dataclasses.dataclass
 class _CpuLoadStoreOpcode(_RsRtImmS16CoderMixin, _LoadStoreArgsConverterMixin, Opcode):
     pass
 
 
-@dataclasses.dataclass
 class _CopNonLoadStoreOpcodeBase(Opcode, abc.ABC):
     COP0_OPCODE: ClassVar[int] = 0x10
     COP1_OPCODE: ClassVar[int] = 0x11
     COP2_OPCODE: ClassVar[int] = 0x12
     COP3_OPCODE: ClassVar[int] = 0x13
-    is_exec_command: bool
+    is_exec_command: ClassVar[bool]
 
-    def encode(self, args: OpcodeArgs) -> EncodedInstruction:
-        return super().encode(args) | (0x2000000 if self.is_exec_command else 0)
+    def encode_base(self) -> EncodedInstruction:
+        return super().encode_base() | (0x2000000 if self.is_exec_command else 0)
+
+    @staticmethod
+    def decode_cop_id(encoded: EncodedInstruction) -> int:
+        return (encoded >> 26) & 0x3
 
     @staticmethod
-    def decode_is_exec_command(encoded) -> bool:
+    def decode_is_exec_command(encoded: EncodedInstruction) -> bool:
         return (encoded & 0x2000000) != 0
 
 
-def _is_exec_command_mixin(flag: bool):
-    @dataclasses.dataclass
+def _is_exec_command_mixin(flag: bool) -> type:
     class _IsExecCommandMixin:
-        is_exec_command: bool = dataclasses.field(init=False, default=flag)
+        is_exec_command = flag
 
     return _IsExecCommandMixin
 
 
-@dataclasses.dataclass
 class _CopNonExecuteCommandOpcodeBase(_is_exec_command_mixin(False), _CopNonLoadStoreOpcodeBase, abc.ABC):
-    discriminator: int
+    def __init__(self, name: str, primary_opcode: int, discriminator: int):
+        super().__init__(name, primary_opcode)
+        self.discriminator = discriminator
 
-    def encode(self, args: OpcodeArgs) -> EncodedInstruction:
-        return super().encode(args) | (self.discriminator << 21)
+    def encode_base(self) -> EncodedInstruction:
+        return super().encode_base() | (self.discriminator << 21)
 
     @staticmethod
-    def decode_discriminator(encoded) -> int:
-        return (encoded & 0x1e00000) >> 21
+    def decode_discriminator(encoded: EncodedInstruction) -> int:
+        return (encoded >> 21) & 0xf
 
 
-@dataclasses.dataclass
 class _CopGetSetRegisterOpcodeBase(_TwoArgsMixin, _CopNonExecuteCommandOpcodeBase, abc.ABC):
     @classmethod
     def args_to_string(cls, context: ExecutionContext, args: OpcodeArgs) -> str:
-        return f'{args.rt}, {args.rd}'
+        decoded_args = cast(_DecodedOpcodeArgs, args)
+        return f'{decoded_args.rt.display}, {decoded_args.rd.display}'
 
     @classmethod
     def encode_args(cls, args: OpcodeArgs) -> int:
         return Helpers.encode_rt(args) | Helpers.encode_rd(args)
 
 
-@dataclasses.dataclass
 class _CopBranchOpcodeBase(_OneArgMixin, _is_exec_command_mixin(False), _CopNonExecuteCommandOpcodeBase, abc.ABC):
-    branch_type: int
+    ARGS_DECODER_SOURCE = 'None, None, None, ((e & 0xffff) ^ 0x8000) - 0x8000'
+    branch_type: ClassVar[int]
 
-    def encode(self, args: OpcodeArgs) -> EncodedInstruction:
-        return super().encode(args) | (self.branch_type << 16)
+    def encode_base(self) -> EncodedInstruction:
+        return super().encode_base() | (self.branch_type << 16)
 
     @staticmethod
-    def decode_branch_type(encoded) -> int:
-        return (encoded & 0x1f0000) >> 16
+    def decode_branch_type(encoded: EncodedInstruction) -> int:
+        return (encoded >> 16) & 0x1f
 
     @classmethod
     def args_to_string(cls, context: ExecutionContext, args: OpcodeArgs) -> str:
         return f'{Helpers.branch_address_string(context, args)}'
 
-    @classmethod
-    def decode_args(cls, encoded: EncodedInstruction) -> OpcodeArgs:
-        return OpcodeArgs(imm=Helpers.decode_s_imm16(encoded))
-
     @classmethod
     def encode_args(cls, args: OpcodeArgs) -> int:
         return Helpers.encode_imm16(args)
 
 
-@dataclasses.dataclass
 class _CopExecuteOpcodeBase(_OneArgMixin, _is_exec_command_mixin(True), _CopNonLoadStoreOpcodeBase):
+    ARGS_DECODER_SOURCE = 'None, None, None, e & 0x1ffffff'
+
     @classmethod
     def args_to_string(cls, context: ExecutionContext, args: OpcodeArgs) -> str:
         return f'0x{args.imm:06X}'
 
-    @classmethod
-    def decode_args(cls, encoded: EncodedInstruction) -> OpcodeArgs:
-        return OpcodeArgs(imm=encoded & 0x1ffffff)
-
     @classmethod
     def encode_args(cls, args: OpcodeArgs) -> int:
-        return args.imm
+        return cast(_DecodedOpcodeArgs, args).imm
 
 
-def _cop_mfc_opcode(cop_id: int):
+def _cop_mfc_opcode(cop_id: int) -> type[_CopGetSetRegisterOpcodeBase]:
     return _cop_get_set_register_opcode('mfc{}', cop_id, registers.cop_dat_by_index[cop_id])
 
 
-def _cop_cfc_opcode(cop_id: int):
+def _cop_cfc_opcode(cop_id: int) -> type[_CopGetSetRegisterOpcodeBase]:
     return _cop_get_set_register_opcode('cfc{}', cop_id, registers.cop_cnt_by_index[cop_id])
 
 
-def _cop_mtc_opcode(cop_id: int):
+def _cop_mtc_opcode(cop_id: int) -> type[_CopGetSetRegisterOpcodeBase]:
     return _cop_get_set_register_opcode('mtc{}', cop_id, registers.cop_dat_by_index[cop_id])
 
 
-def _cop_ctc_opcode(cop_id: int):
+def _cop_ctc_opcode(cop_id: int) -> type[_CopGetSetRegisterOpcodeBase]:
     return _cop_get_set_register_opcode('ctc{}', cop_id, registers.cop_cnt_by_index[cop_id])
 
 
-def _cop_bcf_opcode(cop_id: int):
+def _cop_bcf_opcode(cop_id: int) -> type[_CopBranchOpcodeBase]:
     return _cop_branch_opcode('f', cop_id, type_=0b00000)
 
 
-def _cop_bct_opcode(cop_id: int):
+def _cop_bct_opcode(cop_id: int) -> type[_CopBranchOpcodeBase]:
     return _cop_branch_opcode('t', cop_id, type_=0b00001)
 
 
-def _cop_execute_opcode(cop_id: int):
-    @dataclasses.dataclass
+def _cop_execute_opcode(cop_id: int) -> type[_CopExecuteOpcodeBase]:
     class _CopExecuteOpcode(_cop_non_load_store_opcode('cop{}', cop_id, _CopExecuteOpcodeBase)):
         pass
 
     return _CopExecuteOpcode
 
 
-def _cop_lwc_opcode(cop_id: int):
+def _cop_lwc_opcode(cop_id: int) -> type[Opcode]:
     return _cop_load_store_opcode('lwc{}', cop_id, primary=0x30)
 
 
-def _cop_swc_opcode(cop_id: int):
+def _cop_swc_opcode(cop_id: int) -> type[Opcode]:
     return _cop_load_store_opcode('swc{}', cop_id, primary=0x38)
 
 
-def _cop_opcode_name_mixin(name_format: str, cop_id: int):
-    @dataclasses.dataclass
-    class _CopOpcodeNameMixin:
-        name: str = dataclasses.field(init=False, default=name_format.format(cop_id))
-
-    return _CopOpcodeNameMixin
-
-
 def _cop_get_set_register_opcode(base_name: str, cop_id: int, cop_registers: list[Register]) -> type[_CopGetSetRegisterOpcodeBase]:
-    @dataclasses.dataclass
     class _CopGetSetRegisterOpcode(_cop_non_load_store_opcode(base_name, cop_id, _CopGetSetRegisterOpcodeBase)):
-        @classmethod
-        def args_to_string(cls, context: ExecutionContext, args: OpcodeArgs) -> str:
-            return f'{args.rt}, {args.rd}'
+        COP_REGISTERS = cop_registers
+        ARGS_DECODER_SOURCE = 'None, _cpu[(e >> 16) & 0x1f], _cop_registers[(e >> 11) & 0x1f], None'
 
         @classmethod
-        def decode_args(cls, encoded: EncodedInstruction) -> OpcodeArgs:
-            return OpcodeArgs(rt=Helpers.decode_rt(encoded), rd=cop_registers[Helpers.decode_rd_index(encoded)])
+        def args_to_string(cls, context: ExecutionContext, args: OpcodeArgs) -> str:
+            decoded_args = cast(_DecodedOpcodeArgs, args)
+            return f'{decoded_args.rt.display}, {decoded_args.rd.display}'
 
         @classmethod
         def encode_args(cls, args: OpcodeArgs) -> int:
@@ -586,15 +583,13 @@ def _cop_get_set_register_opcode(base_name: str, cop_id: int, cop_registers: lis
 
 
 def _cop_branch_opcode(suffix: str, cop_id: int, type_: int) -> type[_CopBranchOpcodeBase]:
-    @dataclasses.dataclass
     class _CopBranchOpcode(_cop_non_load_store_opcode(f'bc{{}}{suffix}', cop_id, _CopBranchOpcodeBase)):
-        branch_type: int = dataclasses.field(init=False, default=type_)
+        branch_type = type_
 
     return _CopBranchOpcode
 
 
 def _cop_non_load_store_opcode[T](name_format: str, cop_id: int, base_class: type[T]) -> type[T]:
-    @dataclasses.dataclass
     class _CopNonLoadStoreOpcode(
             _cop_opcode_mixin(name_format, cop_id, primary=_CopNonLoadStoreOpcodeBase.COP0_OPCODE),
             base_class,
@@ -604,29 +599,26 @@ def _cop_non_load_store_opcode[T](name_format: str, cop_id: int, base_class: typ
     return _CopNonLoadStoreOpcode
 
 
-def _cop_load_store_opcode(base_name: str, cop_id: int, primary: int):
-    @dataclasses.dataclass
+def _cop_load_store_opcode(base_name: str, cop_id: int, primary: int) -> type[Opcode]:
     class _CopLoadStoreOpcode(
             _cop_opcode_mixin(base_name, cop_id, primary),
             _RsRtImm16EncoderMixin,
             _LoadStoreArgsConverterMixin,
             Opcode):
-        @classmethod
-        def decode_args(cls, encoded: EncodedInstruction) -> OpcodeArgs:
-            return OpcodeArgs(
-                rs=Helpers.decode_rs(encoded),
-                rt=registers.cop_dat_by_index[cop_id][Helpers.decode_rt_index(encoded)],
-                imm=Helpers.decode_s_imm16(encoded))
-
-        pass
+        COP_REGISTERS = registers.cop_dat_by_index[cop_id]
+        ARGS_DECODER_SOURCE = \
+            '_cpu[(e >> 21) & 0x1f], _cop_registers[(e >> 16) & 0x1f], None, ((e & 0xffff) ^ 0x8000) - 0x8000'
 
     return _CopLoadStoreOpcode
 
 
 def _cop_opcode_mixin(name_format: str, cop_id_: int, primary: int) -> type:
-    @dataclasses.dataclass
-    class _CopOpcodeMixin(_cop_opcode_name_mixin(name_format, cop_id_), _primary_opcode_mixin(primary + cop_id_)):
-        cop_id: int = cop_id_
+    class _CopOpcodeMixin(_primary_opcode_mixin(primary + cop_id_)):
+        NAME: ClassVar[str] = name_format.format(cop_id_)
+        cop_id: ClassVar[int] = cop_id_
+
+        def __init__(self, **kwargs):
+            super().__init__(self.NAME, self.PRIMARY_OPCODE, **kwargs)
 
     return _CopOpcodeMixin
 
@@ -716,161 +708,195 @@ class Opcodes:
     swr = _CpuLoadStoreOpcode('swr', primary_opcode=0x2e)
 
 
-@dataclasses.dataclass
-class Instruction:
+class Instruction(NamedTuple):
     opcode: Opcode
     args: OpcodeArgs
 
-    def to_string(self, context: ExecutionContext):
+    def to_string(self, context: ExecutionContext) -> str:
         return self.opcode.to_string(context, self.args)
 
     def encode(self) -> EncodedInstruction:
         return self.opcode.encode(self.args)
 
     def is_valid(self) -> bool:
-        return not isinstance(self.opcode, InvalidOpcode)
+        return self.opcode.IS_VALID
 
 
-@dataclasses.dataclass
 class InvalidInstruction(Instruction):
-    opcode: InvalidOpcode
-    args: OpcodeArgs = dataclasses.field(init=False, default_factory=OpcodeArgs)
+    __slots__ = ()
+
+    def __new__(cls, opcode: InvalidOpcode, args: OpcodeArgs = OpcodeArgs()):
+        return tuple.__new__(cls, (opcode, args))
+
+
+_INSTRUCTION_CACHE_SIZE = 0x1000
+_INSTRUCTION_CACHE_MASK = _INSTRUCTION_CACHE_SIZE - 1
 
 
 class Decoder:
     def __init__(self):
-        self._primary_decoders: list[OpcodeDecoder | None] = [None] * 0x40
-        self._branch_zero_condition_decoders: list[OpcodeDecoder | None] = [None] * 0x20
-        self._secondary_decoders: list[OpcodeDecoder | None] = [None] * 0x40
-        self._coprocessor_with_discriminator_decoders: list[list[OpcodeDecoder | None]] = \
-            [[None] * 0x10, [None] * 0x10, [None] * 0x10, [None] * 0x10]
-        self._primary_decoders[SecondaryOpcode.PRIMARY_OPCODE] = self._secondary_opcode_decoder
-        self._primary_decoders[BranchZeroConditionWithDiscriminatorOpcode.PRIMARY_OPCODE] = \
-            self._branch_zero_condition_with_discriminator_opcode_decoder
-        self._insert_primary_opcode_decoders(
+        self._instruction_cache: list[tuple[EncodedInstruction, Instruction] | None] = [None] * _INSTRUCTION_CACHE_SIZE
+        self._decoder_indices: array.array = _DECODER_INDICES
+        self._decoders: tuple[OpcodeDecoder, ...] = _DECODERS
+
+    def decode(self, encoded: EncodedInstruction) -> Instruction:
+        slot = encoded & _INSTRUCTION_CACHE_MASK
+        cache_entry = self._instruction_cache[slot]
+        if cache_entry is not None and cache_entry[0] == encoded:
+            return cache_entry[1]
+        instruction = self.decode_uncached(encoded)
+        self._instruction_cache[slot] = (encoded, instruction)
+        return instruction
+
+    def decode_uncached(self, encoded: EncodedInstruction) -> Instruction:
+        return self._decoders[self._decoder_indices[((encoded >> 20) & 0xfc0) | (encoded & 0x3f)]](encoded)
+
+    def decode_many(self, words: Iterable[EncodedInstruction]) -> list[Instruction]:
+        to_list = getattr(words, 'tolist', None)
+        words = to_list() if to_list is not None else list(words)
+        decode_uncached = self.decode_uncached
+        instructions = {encoded: decode_uncached(encoded) for encoded in set(words)}
+        return [instructions[encoded] for encoded in words]
+
+    @staticmethod
+    def _invalid_primary_opcode_decoder(encoded: EncodedInstruction) -> Instruction:
+        return Decoder._create_invalid_instruction(
+            encoded, f'Invalid primary opcode 0x{Opcode.decode_primary(encoded):02X}')
+
+    @staticmethod
+    def _invalid_secondary_opcode_decoder(encoded: EncodedInstruction) -> Instruction:
+        return Decoder._create_invalid_instruction(
+            encoded, f'Invalid secondary opcode 0x{SecondaryOpcode.decode_secondary(encoded):02X}')
+
+    @staticmethod
+    def _invalid_branch_zero_condition_decoder(encoded: EncodedInstruction) -> Instruction:
+        return Decoder._create_invalid_instruction(
+            encoded,
+            'Invalid bXXz discriminator '
+            f'0x{BranchZeroConditionWithDiscriminatorOpcode.decode_discriminator(encoded):02X}')
+
+    @staticmethod
+    def _invalid_cop_discriminator_decoder(encoded: EncodedInstruction) -> Instruction:
+        return Decoder._create_invalid_instruction(encoded, '')
+
+    @staticmethod
+    def _branch_zero_condition_with_discriminator_opcode_decoder(encoded: EncodedInstruction) -> Instruction:
+        return _BRANCH_ZERO_CONDITION_DECODERS[(encoded >> 16) & 0x1f](encoded)
+
+    @staticmethod
+    def _cop_non_load_store_decoder(encoded: EncodedInstruction) -> Instruction:
+        cop_id = (encoded >> 26) & 0x3
+        if encoded & 0x2000000:
+            return _COP_EXECUTE_DECODERS[cop_id](encoded)
+        return _COPROCESSOR_WITH_DISCRIMINATOR_DECODERS[cop_id][(encoded >> 21) & 0xf](encoded)
+
+    @staticmethod
+    def _invalid_cop_branch_type_decoder(encoded: EncodedInstruction) -> Instruction:
+        return Decoder._create_invalid_instruction(
+            encoded, f'Invalid cop branch type 0x{_CopBranchOpcodeBase.decode_branch_type(encoded):X}')
+
+    @staticmethod
+    def _cop_branch_decoder(encoded: EncodedInstruction) -> Instruction:
+        return _COP_BRANCH_DECODERS[(encoded >> 26) & 0x3][(encoded >> 16) & 0x1f](encoded)
+
+    @staticmethod
+    def _create_invalid_instruction(encoded: EncodedInstruction, cause: str) -> 'InvalidInstruction':
+        return InvalidInstruction(InvalidOpcode(encoded=encoded, cause=cause))
+
+    @staticmethod
+    def _create_from_opcode_decoder(opcode: Opcode) -> OpcodeDecoder:
+        return _compile_args_decoder(
+            type(opcode), f'decode_{opcode.name}', 'e', '_new(_instruction, (_opcode, {args}))',
+            _instruction=Instruction, _opcode=opcode)
+
+
+def _primary_decoders() -> list[OpcodeDecoder]:
+    decoders: list[OpcodeDecoder] = [Decoder._invalid_primary_opcode_decoder] * 0x40
+    decoders[BranchZeroConditionWithDiscriminatorOpcode.PRIMARY_OPCODE] = \
+        Decoder._branch_zero_condition_with_discriminator_opcode_decoder
+    for opcode in (
             Opcodes.j, Opcodes.jal,
             Opcodes.beq, Opcodes.bne, Opcodes.blez, Opcodes.bgtz,
             Opcodes.addiu, Opcodes.addi, Opcodes.slti, Opcodes.sltiu,
             Opcodes.andi, Opcodes.ori, Opcodes.xori, Opcodes.lui,
             Opcodes.lb, Opcodes.lh, Opcodes.lwl, Opcodes.lw, Opcodes.lbu, Opcodes.lhu, Opcodes.lwr,
-            Opcodes.sb, Opcodes.sh, Opcodes.swl, Opcodes.sw, Opcodes.swr)
-        self._insert_secondary_opcode_decoders(
+            Opcodes.sb, Opcodes.sh, Opcodes.swl, Opcodes.sw, Opcodes.swr,
+            *Opcodes.lwc, *Opcodes.swc):
+        decoders[opcode.primary_opcode] = Decoder._create_from_opcode_decoder(opcode)
+    for primary in range(_CopNonLoadStoreOpcodeBase.COP0_OPCODE, _CopNonLoadStoreOpcodeBase.COP3_OPCODE + 1):
+        decoders[primary] = Decoder._cop_non_load_store_decoder
+    return decoders
+
+
+def _secondary_decoders() -> list[OpcodeDecoder]:
+    decoders: list[OpcodeDecoder] = [Decoder._invalid_secondary_opcode_decoder] * 0x40
+    for opcode in (
             Opcodes.sll, Opcodes.srl, Opcodes.sra, Opcodes.sllv, Opcodes.srlv, Opcodes.srav,
             Opcodes.jr, Opcodes.jalr, Opcodes.syscall, Opcodes.break_,
             Opcodes.mfhi, Opcodes.mthi, Opcodes.mflo, Opcodes.mtlo,
             Opcodes.mult, Opcodes.multu, Opcodes.div, Opcodes.divu,
             Opcodes.add, Opcodes.addu, Opcodes.sub, Opcodes.subu, Opcodes.and_, Opcodes.or_, Opcodes.xor, Opcodes.nor,
-            Opcodes.slt, Opcodes.sltu)
-        self._insert_zero_condition_decoders(Opcodes.bltz, Opcodes.bgez, Opcodes.bltzal, Opcodes.bgezal)
-        self._primary_decoders[_CopNonLoadStoreOpcodeBase.COP0_OPCODE] = \
-            lambda encoded: self._cop_non_load_store_decoder(encoded, cop_id=0)
-        self._primary_decoders[_CopNonLoadStoreOpcodeBase.COP1_OPCODE] = \
-            lambda encoded: self._cop_non_load_store_decoder(encoded, cop_id=1)
-        self._primary_decoders[_CopNonLoadStoreOpcodeBase.COP2_OPCODE] = \
-            lambda encoded: self._cop_non_load_store_decoder(encoded, cop_id=2)
-        self._primary_decoders[_CopNonLoadStoreOpcodeBase.COP3_OPCODE] = \
-            lambda encoded: self._cop_non_load_store_decoder(encoded, cop_id=3)
-        self._insert_coprocessor_with_discriminator_decoders(Opcodes.mfc, Opcodes.cfc, Opcodes.mtc, Opcodes.ctc)
-        self._coprocessor_with_discriminator_decoders[0][Opcodes.bcf[0].discriminator] = \
-            lambda encoded: self._cop_branch_decoder(encoded, 0)
-        self._coprocessor_with_discriminator_decoders[1][Opcodes.bcf[1].discriminator] = \
-            lambda encoded: self._cop_branch_decoder(encoded, 1)
-        self._coprocessor_with_discriminator_decoders[2][Opcodes.bcf[2].discriminator] = \
-            lambda encoded: self._cop_branch_decoder(encoded, 2)
-        self._coprocessor_with_discriminator_decoders[3][Opcodes.bcf[3].discriminator] = \
-            lambda encoded: self._cop_branch_decoder(encoded, 3)
-        self._insert_coprocessor_decoders(Opcodes.lwc, Opcodes.swc)
+            Opcodes.slt, Opcodes.sltu):
+        decoders[opcode.secondary_opcode] = Decoder._create_from_opcode_decoder(opcode)
+    return decoders
 
-    def decode(self, encoded: EncodedInstruction) -> Instruction:
-        return Decoder._decoder(
-            self._primary_decoders,
-            Opcode.decode_primary(encoded),
-            encoded,
-            lambda primary: f'Invalid primary opcode 0x{primary:02X}')
-
-    def _insert_primary_opcode_decoders(self, *opcodes: Opcode):
-        for opcode in opcodes:
-            self._primary_decoders[opcode.primary_opcode] = Decoder._create_from_opcode_decoder(opcode)
-
-    def _insert_secondary_opcode_decoders(self, *opcodes: SecondaryOpcode):
-        for opcode in opcodes:
-            self._secondary_decoders[opcode.secondary_opcode] = Decoder._create_from_opcode_decoder(opcode)
-
-    def _insert_zero_condition_decoders(self, *opcodes: BranchZeroConditionWithDiscriminatorOpcode):
-        for opcode in opcodes:
-            self._branch_zero_condition_decoders[opcode.discriminator] = Decoder._create_from_opcode_decoder(opcode)
-
-    def _insert_coprocessor_with_discriminator_decoders(self, *opcodes: tuple[Opcode, ...]):
-        for coprocessor_opcodes in opcodes:
-            for cop_id, opcode in enumerate(coprocessor_opcodes):
-                opcode = typing.cast(_CopNonExecuteCommandOpcodeBase, opcode)
-                self._coprocessor_with_discriminator_decoders[cop_id][opcode.discriminator] = \
-                    Decoder._create_from_opcode_decoder(opcode)
-
-    def _insert_coprocessor_decoders(self, *opcodes: tuple[Opcode, ...]):
-        for coprocessor_opcodes in opcodes:
-            self._insert_primary_opcode_decoders(*coprocessor_opcodes)
-
-    def _secondary_opcode_decoder(self, encoded: EncodedInstruction) -> Instruction:
-        return Decoder._decoder(
-            self._secondary_decoders,
-            SecondaryOpcode.decode_secondary(encoded),
-            encoded,
-            lambda secondary: f'Invalid secondary opcode 0x{secondary:02X}')
 
-    def _branch_zero_condition_with_discriminator_opcode_decoder(self, encoded: EncodedInstruction) -> Instruction:
-        return Decoder._decoder(
-            self._branch_zero_condition_decoders,
-            BranchZeroConditionWithDiscriminatorOpcode.decode_discriminator(encoded),
-            encoded,
-            lambda discriminator: f'Invalid bXXz discriminator 0x{discriminator:02X}')
+def _branch_zero_condition_decoders() -> list[OpcodeDecoder]:
+    decoders: list[OpcodeDecoder] = [Decoder._invalid_branch_zero_condition_decoder] * 0x20
+    for opcode in (Opcodes.bltz, Opcodes.bgez, Opcodes.bltzal, Opcodes.bgezal):
+        decoders[opcode.discriminator] = Decoder._create_from_opcode_decoder(opcode)
+    return decoders
 
-    def _cop_non_load_store_decoder(self, encoded: EncodedInstruction, cop_id: int) -> Instruction:
-        is_exec_command = _CopNonLoadStoreOpcodeBase.decode_is_exec_command(encoded)
-        if is_exec_command:
-            return Decoder._instruction_from_opcode(Opcodes.cop[cop_id], encoded)
-        else:
-            return Decoder._decoder(
-                self._coprocessor_with_discriminator_decoders[cop_id],
-                _CopNonExecuteCommandOpcodeBase.decode_discriminator(encoded),
-                encoded,
-                lambda discriminator: '')
 
-    @staticmethod
-    def _cop_branch_decoder(encoded: EncodedInstruction, cop_id: int) -> Instruction:
-        branch_type = _CopBranchOpcodeBase.decode_branch_type(encoded)
-        if branch_type == 0:
-            return Decoder._instruction_from_opcode(Opcodes.bcf[cop_id], encoded)
-        if branch_type == 1:
-            return Decoder._instruction_from_opcode(Opcodes.bct[cop_id], encoded)
-        return Decoder._create_invalid_instruction(encoded, f'Invalid cop branch type 0x{branch_type:X}')
+def _coprocessor_with_discriminator_decoders(cop_id: int) -> tuple[OpcodeDecoder, ...]:
+    decoders: dict[int, OpcodeDecoder] = {
+        opcode.discriminator: Decoder._create_from_opcode_decoder(opcode)
+        for opcode in (Opcodes.mfc[cop_id], Opcodes.cfc[cop_id], Opcodes.mtc[cop_id], Opcodes.ctc[cop_id])}
+    decoders[Opcodes.bcf[cop_id].discriminator] = Decoder._cop_branch_decoder
+    return tuple(
+        decoders.get(discriminator, Decoder._invalid_cop_discriminator_decoder) for discriminator in range(0x10))
 
-    @staticmethod
-    def _decoder(
-            decoders: list[OpcodeDecoder],
-            i: int,
-            encoded: EncodedInstruction,
-            invalid_cause_creator: Callable[[int], str]) -> Instruction:
-        decoder = decoders[i]
-        if decoder is not None:
-            return decoder(encoded)
-        return Decoder._create_invalid_instruction(encoded, invalid_cause_creator(i))
 
-    @staticmethod
-    def _create_invalid_instruction(encoded: EncodedInstruction, cause: str):
-        return InvalidInstruction(InvalidOpcode(encoded=encoded, cause=cause))
+def _cop_branch_decoders(cop_id: int) -> tuple[OpcodeDecoder, ...]:
+    decoders: list[OpcodeDecoder] = [Decoder._invalid_cop_branch_type_decoder] * 0x20
+    for opcode in (Opcodes.bcf[cop_id], Opcodes.bct[cop_id]):
+        decoders[opcode.branch_type] = Decoder._create_from_opcode_decoder(opcode)
+    return tuple(decoders)
 
-    @staticmethod
-    def _create_from_opcode_decoder(opcode: Opcode):
-        return lambda encoded: Decoder._instruction_from_opcode(opcode, encoded)
 
-    @staticmethod
-    def _instruction_from_opcode(opcode: Opcode, encoded: EncodedInstruction) -> Instruction:
-        return Instruction(opcode, opcode.decode_args(encoded))
+def _flat_decoders(
+        primary_decoders: list[OpcodeDecoder],
+        secondary_decoders: list[OpcodeDecoder]) -> list[OpcodeDecoder]:
+    decoders = []
+    for primary, primary_decoder in enumerate(primary_decoders):
+        if primary == SecondaryOpcode.PRIMARY_OPCODE:
+            decoders.extend(secondary_decoders)
+        else:
+            decoders.extend([primary_decoder] * 0x40)
+    return decoders
+
+
+def _indexed_decoders(decoders: list[OpcodeDecoder]) -> tuple[array.array, tuple[OpcodeDecoder, ...]]:
+    unique_decoders = tuple(dict.fromkeys(decoders))
+    index_by_decoder = {decoder: index for index, decoder in enumerate(unique_decoders)}
+    return array.array('B', (index_by_decoder[decoder] for decoder in decoders)), unique_decoders
 
 
+_BRANCH_ZERO_CONDITION_DECODERS = tuple(_branch_zero_condition_decoders())
+_COPROCESSOR_WITH_DISCRIMINATOR_DECODERS = tuple(_coprocessor_with_discriminator_decoders(cop_id) for cop_id in range(4))
+_COP_BRANCH_DECODERS = tuple(_cop_branch_decoders(cop_id) for cop_id in range(4))
+_COP_EXECUTE_DECODERS = tuple(Decoder._create_from_opcode_decoder(opcode) for opcode in Opcodes.cop)
+_DECODER_INDICES, _DECODERS = _indexed_decoders(_flat_decoders(_primary_decoders(), _secondary_decoders()))
 _decoder = Decoder()
 
 
 def decode(encoded: EncodedInstruction) -> Instruction:
     return _decoder.decode(encoded)
+
+
+def decode_uncached(encoded: EncodedInstruction) -> Instruction:
+    return _decoder.decode_uncached(encoded)
+
+
+def decode_many(words: Iterable[EncodedInstruction]) -> list[Instruction]:
+    return _decoder.decode_many(words)
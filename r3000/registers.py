@@ -1,38 +1,51 @@
+import array
 import dataclasses
+import sys
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True, slots=True)
 class Register:
     name: str
     alias: str
     index: int | None = None
+    display: str = dataclasses.field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, 'display', sys.intern(self.alias))
 
     def __str__(self) -> str:
-        return self.alias
+        return self.display
 
-    def has_index(self):
+    def has_index(self) -> bool:
         return self.index is not None
 
-    def instantiate(self) -> 'RuntimeRegister':
-        return RuntimeRegister(self)
+    def instantiate(self, values: array.array | None = None, index: int = 0) -> 'RuntimeRegister':
+        return RuntimeRegister(self, values, index)
+
+
+def _register_values(count: int) -> array.array:
+    return array.array('q', bytes(8 * count))
 
 
 class RuntimeRegister:
-    def __init__(self, register: Register):
+    __slots__ = ('register', '_values', '_index')
+
+    def __init__(self, register: Register, values: array.array | None = None, index: int = 0):
         self.register = register
-        self._value = 0
+        self._values = values if values is not None else _register_values(1)
+        self._index = index
 
     @property
     def value(self) -> int:
-        return self._value
+        return self._values[self._index]
 
     @value.setter
     def value(self, new_value: int):
-        self._value = new_value
+        self._values[self._index] = new_value
 
 
 cpu_by_index = [
-    Register(name=f'R{i}', alias=f'{alias}', index=i)
+    Register(name=f'R{i}', alias=alias, index=i)
     for i, alias
     in enumerate([
         'zero',
@@ -49,7 +62,10 @@ cpu_by_name = {register.name: register for register in cpu_by_index}
 cpu_by_alias = {register.alias: register for register in cpu_by_index}
 
 
-def _create_cop_by_index(named_registers: dict[int, str], offset: int, unnamed_register_prefix: str):
+def _create_cop_by_index(
+        named_registers: dict[int, str] | None,
+        offset: int,
+        unnamed_register_prefix: str) -> list[Register]:
     named_registers = named_registers or {}
     return [
         Register(
@@ -61,11 +77,11 @@ def _create_cop_by_index(named_registers: dict[int, str], offset: int, unnamed_r
     ]
 
 
-def _create_cop_dat_by_index(named_registers: dict[int, str] = None):
+def _create_cop_dat_by_index(named_registers: dict[int, str] | None = None) -> list[Register]:
     return _create_cop_by_index(named_registers, offset=0, unnamed_register_prefix='dat')
 
 
-def _create_cop_cnt_by_index(named_registers: dict[int, str] = None):
+def _create_cop_cnt_by_index(named_registers: dict[int, str] | None = None) -> list[Register]:
     return _create_cop_by_index(named_registers, offset=0, unnamed_register_prefix='cnt')
 
 
@@ -163,14 +179,35 @@ cop2_datR30 = cop_dat_by_index[2][30]
 cop2_datR31 = cop_dat_by_index[2][31]
 
 
+def _instantiate_registers(static_registers: list[Register], values: array.array) -> list[RuntimeRegister]:
+    return [register.instantiate(values, index) for index, register in enumerate(static_registers)]
+
+
 @dataclasses.dataclass
 class ExecutionContext:
-    cpu_by_index: list[RuntimeRegister] = dataclasses.field(
-        default_factory=lambda: [r.instantiate for r in cpu_by_index])
-    cop_dat_by_index: list[list[RuntimeRegister]] = dataclasses.field(
-        default_factory=lambda: [[r.instantiate for r in copn_registers] for copn_registers in cop_dat_by_index])
-    cop_cnt_by_index: list[list[RuntimeRegister]] = dataclasses.field(
-        default_factory=lambda: [[r.instantiate for r in copn_registers] for copn_registers in cop_dat_by_index])
+    cpu_values: array.array = dataclasses.field(default_factory=lambda: _register_values(32))
+    cop_dat_values: list[array.array] = dataclasses.field(
+        default_factory=lambda: [_register_values(32) for _ in cop_dat_by_index])
+    cop_cnt_values: list[array.array] = dataclasses.field(
+        default_factory=lambda: [_register_values(32) for _ in cop_cnt_by_index])
+    cpu_by_index: list[RuntimeRegister] = dataclasses.field(init=False)
+    cop_dat_by_index: list[list[RuntimeRegister]] = dataclasses.field(init=False)
+    cop_cnt_by_index: list[list[RuntimeRegister]] = dataclasses.field(init=False)
     pc: RuntimeRegister = dataclasses.field(default_factory=pc.instantiate)
     hi: RuntimeRegister = dataclasses.field(default_factory=hi.instantiate)
     lo: RuntimeRegister = dataclasses.field(default_factory=lo.instantiate)
+
+    def __post_init__(self):
+        self.cpu_by_index = _instantiate_registers(cpu_by_index, self.cpu_values)
+        self.cop_dat_by_index = [
+            _instantiate_registers(copn_registers, copn_values)
+            for copn_registers, copn_values in zip(cop_dat_by_index, self.cop_dat_values)]
+        self.cop_cnt_by_index = [
+            _instantiate_registers(copn_registers, copn_values)
+            for copn_registers, copn_values in zip(cop_cnt_by_index, self.cop_cnt_values)]
+
+    def read(self, index: int) -> int:
+        return self.cpu_values[index]
+
+    def write(self, index: int, value: int):
+        self.cpu_values[index] = value
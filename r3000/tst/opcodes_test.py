@@ -185,24 +185,31 @@ class OpcodesTest(unittest.TestCase):
             expected_args_number = instruction_descriptor[2]
             if len(instruction_descriptor) > 3:
                 context.pc.value = instruction_descriptor[3]
-            instruction = opcodes.decode(encoded)
-            instruction_string = instruction.to_string(context)
-            if instruction_string != expected_instruction_string:
-                self.fail(
-                    f"Instruction #{i}. Encoded: 0x{encoded:08x}. "
-                    f"Decoded: {instruction.opcode.name} {instruction.args}. "
-                    f"Mnemonic: '{instruction_string}' vs expected '{expected_instruction_string}'")
-            if instruction.opcode.args_number != expected_args_number:
-                self.fail(
-                    f"Instruction #{i}. Encoded: 0x{encoded:08x}. "
-                    f"Decoded: {instruction.opcode.name} {instruction.args}. "
-                    f"Args number: {instruction.opcode.args_number} vs expected {expected_args_number}")
-            encoded_back = instruction.encode()
-            if encoded != encoded_back:
-                self.fail(
-                    f"Instruction #{i}. Encoded {encoded:08x}. "
-                    f"Decoded: {instruction.opcode.name} {instruction.args}. "
-                    f"Encoded back {encoded_back:08x} differs.")
+            with self.subTest(i=i, encoded=f'0x{encoded:08x}'):
+                instruction = opcodes.decode(encoded)
+                instruction_string = instruction.to_string(context)
+                if instruction_string != expected_instruction_string:
+                    self.fail(
+                        f"Instruction #{i}. Encoded: 0x{encoded:08x}. "
+                        f"Decoded: {instruction.opcode.name} {instruction.args}. "
+                        f"Mnemonic: '{instruction_string}' vs expected '{expected_instruction_string}'")
+                if instruction.opcode.args_number != expected_args_number:
+                    self.fail(
+                        f"Instruction #{i}. Encoded: 0x{encoded:08x}. "
+                        f"Decoded: {instruction.opcode.name} {instruction.args}. "
+                        f"Args number: {instruction.opcode.args_number} vs expected {expected_args_number}")
+                encoded_back = instruction.encode()
+                if encoded != encoded_back:
+                    self.fail(
+                        f"Instruction #{i}. Encoded {encoded:08x}. "
+                        f"Decoded: {instruction.opcode.name} {instruction.args}. "
+                        f"Encoded back {encoded_back:08x} differs.")
+                decoded_args = instruction.opcode.decode_args(encoded)
+                if str(instruction.args) != str(decoded_args):
+                    self.fail(
+                        f"Instruction #{i}. Encoded {encoded:08x}. "
+                        f"Decoded: {instruction.opcode.name} {instruction.args}. "
+                        f"Differs from decode_args: {decoded_args}.")
 
     def test_invalid_opcodes(self):
         descriptors = [
@@ -215,18 +222,55 @@ class OpcodesTest(unittest.TestCase):
         context = registers.ExecutionContext()
         for i, descriptor in enumerate(descriptors):
             encoded, expected_cause = descriptor
-            instruction = opcodes.decode(encoded)
-            instruction_string = instruction.to_string(context)
-            if instruction.is_valid() or instruction_string != 'invalid':
-                self.fail(f"Instruction #{i}. Encoded: 0x{encoded:08x}. Valid instruction: {instruction_string}.")
-            instruction = typing.cast(InvalidInstruction, instruction)
-            if instruction.opcode.cause != expected_cause:
-                self.fail(
-                    f"Instruction #{i}. Encoded: 0x{encoded:08x}. "
-                    f"Cause '{instruction.opcode.cause}' vs expected '{expected_cause}'.")
-            encoded_back = instruction.encode()
-            if encoded != encoded_back:
-                self.fail(f"Instruction #{i}. Encoded {encoded:08x}. Encoded back {encoded_back:08x} differs.")
+            with self.subTest(i=i, encoded=f'0x{encoded:08x}'):
+                instruction = opcodes.decode(encoded)
+                instruction_string = instruction.to_string(context)
+                if instruction.is_valid() or instruction_string != 'invalid':
+                    self.fail(f"Instruction #{i}. Encoded: 0x{encoded:08x}. Valid instruction: {instruction_string}.")
+                instruction = typing.cast(InvalidInstruction, instruction)
+                if instruction.opcode.cause != expected_cause:
+                    self.fail(
+                        f"Instruction #{i}. Encoded: 0x{encoded:08x}. "
+                        f"Cause '{instruction.opcode.cause}' vs expected '{expected_cause}'.")
+                encoded_back = instruction.encode()
+                if encoded != encoded_back:
+                    self.fail(f"Instruction #{i}. Encoded {encoded:08x}. Encoded back {encoded_back:08x} differs.")
+
+    def test_decode_cache(self):
+        context = registers.ExecutionContext()
+        instruction = opcodes.decode(0x00051140)
+        self.assertIs(opcodes.decode(0x00051140), instruction)
+        colliding_instruction = opcodes.decode(0x00061140)
+        self.assertEqual(colliding_instruction.to_string(context), 'sll v0, a2, 0x5')
+        self.assertEqual(opcodes.decode(0x00051140).to_string(context), 'sll v0, a1, 0x5')
+
+    def test_decode_uncached(self):
+        instruction = opcodes.decode(0x00051140)
+        uncached_instruction = opcodes.decode_uncached(0x00051140)
+        self.assertIsNot(uncached_instruction, instruction)
+        self.assertEqual(uncached_instruction, instruction)
+
+    def test_decode_many(self):
+        context = registers.ExecutionContext()
+        words = [0x00051140, 0x8c820004, 0xffffffff, 0x00051140]
+        instructions = opcodes.decode_many(words)
+        self.assertEqual(
+            [instruction.to_string(context) for instruction in instructions],
+            [opcodes.decode(encoded).to_string(context) for encoded in words])
+        self.assertIs(instructions[0], instructions[3])
+
+    def test_decoded_instruction_unpacks_to_opcode_and_args(self):
+        instruction = opcodes.decode(0x8c820004)
+        opcode, args = instruction
+        self.assertIs(opcode, instruction.opcode)
+        self.assertIs(args, instruction.args)
+
+    def test_decoded_instructions_are_immutable(self):
+        instruction = opcodes.decode(0x00051140)
+        with self.assertRaises(AttributeError):
+            instruction.args = opcodes.OpcodeArgs()
+        with self.assertRaises(AttributeError):
+            instruction.args.imm = 0
 
 
 if __name__ == '__main__':
@@ -0,0 +1,33 @@
+import unittest
+from r3000 import registers
+
+
+class ExecutionContextTest(unittest.TestCase):
+    def test_runtime_registers(self):
+        context = registers.ExecutionContext()
+        self.assertIs(context.cpu_by_index[5].register, registers.a1)
+        self.assertIs(context.cop_dat_by_index[2][0].register, registers.cop2_datR0)
+        self.assertIs(context.cop_cnt_by_index[2][31].register, registers.cop_cnt_by_index[2][31])
+        self.assertEqual(context.cpu_by_index[5].value, 0)
+
+    def test_runtime_registers_share_values(self):
+        context = registers.ExecutionContext()
+        context.cpu_by_index[5].value = 0x80010000
+        self.assertEqual(context.read(5), 0x80010000)
+        context.write(6, 0x1234)
+        self.assertEqual(context.cpu_by_index[6].value, 0x1234)
+        context.cop_cnt_by_index[2][31].value = 0x10
+        self.assertEqual(context.cop_cnt_values[2][31], 0x10)
+        self.assertEqual(context.cop_dat_values[2][31], 0)
+
+    def test_contexts_do_not_share_values(self):
+        context = registers.ExecutionContext()
+        other_context = registers.ExecutionContext()
+        context.pc.value = 0x80010000
+        context.write(1, 1)
+        self.assertEqual(other_context.pc.value, 0)
+        self.assertEqual(other_context.read(1), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
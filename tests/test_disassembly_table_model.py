@@ -0,0 +1,51 @@
+import unittest
+import numpy as np
+from PySide6.QtCore import Qt
+from ui.models.disassembly_table_model import DisassemblyTableModel
+
+
+class DisassemblyTableModelTest(unittest.TestCase):
+    def setUp(self):
+        self.sut = DisassemblyTableModel()
+        self.sut.set_words(
+            np.array([0x27bdffe8, 0x00851020, 0x00000000, 0x1480fffe, 0x0c000010], dtype=np.uint32),
+            base_address=0x80010000)
+
+    def row_strings(self, row: int) -> list[str]:
+        return [self.sut.data(self.sut.index(row, column)) for column in range(self.sut.columnCount())]
+
+    def test_row_count(self):
+        self.assertEqual(self.sut.rowCount(), 5)
+        self.assertEqual(self.sut.rowCount(self.sut.index(0, 0)), 0)
+        self.sut.set_words(np.zeros(0, dtype=np.uint32))
+        self.assertEqual(self.sut.rowCount(), 0)
+
+    def test_headers(self):
+        self.assertEqual(self.sut.columnCount(), len(DisassemblyTableModel.HEADERS))
+        self.assertEqual(
+            [self.sut.headerData(section, Qt.Orientation.Horizontal) for section in range(self.sut.columnCount())],
+            list(DisassemblyTableModel.HEADERS))
+
+    def test_data_columns(self):
+        self.assertEqual(
+            self.row_strings(0), ['80010000', '27BDFFE8', 'addiu', 'sp, sp, -0x18', 'sp', 'sp', '', '-0x18'])
+        self.assertEqual(self.row_strings(1), ['80010004', '00851020', 'add', 'v0, a0, a1', 'a0', 'a1', 'v0', ''])
+        self.assertEqual(
+            self.row_strings(2), ['80010008', '00000000', 'sll', 'zero, zero, 0x0', '', 'zero', 'zero', '0x0'])
+
+    def test_branch_operands_resolve_target_from_row_address(self):
+        self.assertEqual(
+            self.row_strings(3), ['8001000C', '1480FFFE', 'bne', 'a0, zero, 0x80010008', 'a0', 'zero', '', '-0x2'])
+        self.assertEqual(self.row_strings(4), ['80010010', '0C000010', 'jal', '0x80000040', '', '', '', '0x10'])
+
+    def test_address_column_follows_base_address(self):
+        self.sut.set_words(np.array([0, 0], dtype=np.uint32), base_address=0x1000)
+        self.assertEqual(self.sut.data(self.sut.index(0, 0)), '00001000')
+        self.assertEqual(self.sut.data(self.sut.index(1, 0)), '00001004')
+
+    def test_data_ignores_other_roles(self):
+        self.assertIsNone(self.sut.data(self.sut.index(0, 0), Qt.ItemDataRole.EditRole))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,9 @@
+import os
 import unittest
+import numpy as np
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+from PySide6.QtCore import QRect
+from PySide6.QtGui import QFont, QFontMetrics, QGuiApplication
 from ui.widgets import hex_editor_widget
 
 
@@ -41,6 +46,14 @@ class CursorTest(unittest.TestCase):
         self.assertEqual(self.sut.position_to_grid(16), (0, 3, 4))
         self.assertEqual(self.sut.position_to_grid(17), (1, 0, 0))
 
+    def test_positions_to_grid(self):
+        self.configure_sut(bytes_in_group=2, groups_per_row=4)
+        positions = [0, 1, 3, 4, 16, 17]
+        rows, groups, nibbles = self.sut.positions_to_grid(positions)
+        self.assertEqual(
+            list(zip(rows.tolist(), groups.tolist(), nibbles.tolist())),
+            [self.sut.position_to_grid(position) for position in positions])
+
     def test_grid_to_position(self):
         self.configure_sut(bytes_in_group=4, groups_per_row=3)
         self.assertEqual(self.sut.grid_to_position(row=0, group=2, nibble=4), 20)
@@ -91,5 +104,90 @@ class CursorTest(unittest.TestCase):
         test_move_to(anchor=29, position=30, expected_anchor=28)
 
 
+class DataTest(unittest.TestCase):
+    def setUp(self):
+        self.sut = hex_editor_widget._Data()
+
+    def test_modified_groups(self):
+        self.sut.group_size = 4
+        self.sut.groups_per_row = 2
+        self.sut.update_bytes_per_row()
+        self.sut.update_data_bytes(np.arange(10, dtype=np.uint8))
+        self.assertEqual(self.sut.modified_groups.tolist(), [False, False, False])
+        self.sut.mark_modified(5)
+        self.assertEqual(self.sut.modified_groups.tolist(), [False, True, False])
+        self.sut.mark_modified(slice(9, None))
+        self.assertTrue(self.sut.is_modified(5))
+        self.assertTrue(self.sut.is_modified(9))
+        self.assertFalse(self.sut.is_modified(4))
+        self.assertEqual(self.sut.modified_groups.tolist(), [False, True, True])
+
+    def test_clear_modified(self):
+        self.sut.group_size = 4
+        self.sut.groups_per_row = 2
+        self.sut.update_bytes_per_row()
+        self.sut.update_data_bytes(np.arange(10, dtype=np.uint8))
+        self.sut.mark_modified(slice(None))
+        self.sut.clear_modified(5)
+        self.assertFalse(self.sut.is_modified(5))
+        self.assertTrue(self.sut.is_modified(6))
+        self.assertEqual(self.sut.modified_groups.tolist(), [True, True, True])
+        self.sut.clear_modified(slice(4, 8))
+        self.assertEqual(self.sut.modified_groups.tolist(), [True, False, True])
+        self.sut.clear_modified(8)
+        self.assertEqual(self.sut.modified_groups.tolist(), [True, False, True])
+        self.sut.clear_modified(9)
+        self.assertEqual(self.sut.modified_groups.tolist(), [True, False, False])
+
+
+class SelectionRectsTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QGuiApplication.instance() or QGuiApplication([])
+
+    def setUp(self):
+        self.data = hex_editor_widget._Data()
+        self.data.group_size = 2
+        self.data.groups_per_row = 4
+        self.data.cursor.positions_in_group = self.data.nibbles_per_group
+        self.data.cursor.positions_in_row = self.data.cursor.positions_in_group * self.data.groups_per_row + 1
+        self.data.update_bytes_per_row()
+        self.data.update_data_bytes(np.arange(32, dtype=np.uint8))
+        self.metrics = hex_editor_widget._Metrics(self.data)
+        font = QFont('Consolas')
+        font.setPixelSize(20)
+        self.metrics.update(QFontMetrics(font))
+        self.sut = hex_editor_widget._Painter(self.data, self.metrics)
+
+    def nibbles_rect(self, top_left: tuple[int, int, int], bottom_right: tuple[int, int, int]) -> QRect:
+        return QRect(
+            self.metrics.data_cell_nibble_top_left(*top_left),
+            self.metrics.data_cell_nibble_bottom_right(*bottom_right))
+
+    def test_one_row(self):
+        self.assertEqual(self.sut.selection_rects(1, 6), [self.nibbles_rect((0, 0, 1), (0, 1, 2))])
+
+    def test_two_rows(self):
+        self.assertEqual(
+            self.sut.selection_rects(5, 20),
+            [self.nibbles_rect((0, 1, 1), (0, 3, 3)), self.nibbles_rect((1, 0, 0), (1, 0, 3))])
+
+    def test_three_or_more_rows(self):
+        self.assertEqual(
+            self.sut.selection_rects(5, 40),
+            [
+                self.nibbles_rect((0, 1, 1), (0, 3, 3)),
+                self.nibbles_rect((1, 0, 0), (1, 3, 3)),
+                self.nibbles_rect((2, 0, 0), (2, 1, 2))
+            ])
+        self.assertEqual(
+            self.sut.selection_rects(5, 57),
+            [
+                self.nibbles_rect((0, 1, 1), (0, 3, 3)),
+                self.nibbles_rect((1, 0, 0), (2, 3, 3)),
+                self.nibbles_rect((3, 0, 0), (3, 1, 2))
+            ])
+
+
 if __name__ == '__main__':
     unittest.main()
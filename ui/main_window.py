@@ -1,12 +1,20 @@
 import numpy as np
 from PySide6.QtGui import QAction
-from PySide6.QtWidgets import QMainWindow, QWidget, QToolBar, QTabWidget, QTableWidget, QToolButton
+from PySide6.QtWidgets import QMainWindow, QWidget, QToolBar, QTabWidget, QTableView
 from PySide6.QtWidgets import QVBoxLayout, QGridLayout
 from . import resources
 from .resources import Icons
+from .models.disassembly_table_model import DisassemblyTableModel
 from .widgets.hex_editor_widget import HexEditorWidget
 
 
+_DEMO_WORDS = np.array([
+    0x27bdffe8, 0xafbf0010, 0x0c000010, 0x00000000, 0x2484ffff,
+    0x1480fffe, 0x00000000, 0x8fbf0010, 0x03e00008, 0x27bd0018],
+    dtype=np.uint32)
+_DEMO_BASE_ADDRESS = 0x80010000
+
+
 class TabPageWidget(QWidget):
     def __init__(self, tab_widget: QTabWidget, page_label: str):
         super().__init__(tab_widget)
@@ -18,17 +26,14 @@ class R3000PageCoderPageWidget(TabPageWidget):
         super().__init__(tab_widget, page_label='R3000 coder')
         self._main_layout = QVBoxLayout(self)
         self._toolbar = QToolBar(self)
-        self._tt = QToolButton(self._toolbar)
-        self._tt.setIcon(resources.load_icon(Icons.binary_24))
-        #self._tt.triggered.connect(self._clicked)
-        self._act = self._toolbar.addWidget(self._tt)
-        self._tt.pressed.connect(self._clicked)
         self._act2 = QAction("Test action", self)
+        self._act2.setIcon(resources.load_icon(Icons.binary_24))
         self._act2.triggered.connect(self._clicked)
         self._toolbar.addAction(self._act2)
-        self._coder_table_widget = QTableWidget(self)
-        self._coder_table_widget.setColumnCount(5)
-        self._coder_table_widget.setHorizontalHeaderLabels(["Encoding", "Opcode", "Arg 1", "Arg 2", "Arg 3"])
+        self._coder_table_model = DisassemblyTableModel(self)
+        self._coder_table_widget = QTableView(self)
+        self._coder_table_widget.setModel(self._coder_table_model)
+        self._coder_table_model.set_words(_DEMO_WORDS, base_address=_DEMO_BASE_ADDRESS)
         self._main_layout.addWidget(self._toolbar)
         self._main_layout.addWidget(self._coder_table_widget)
         self._hex_widget = HexEditorWidget(self)
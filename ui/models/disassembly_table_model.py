@@ -0,0 +1,66 @@
+import numpy as np
+import numpy.typing as npt
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, QPersistentModelIndex, QObject
+from r3000 import opcodes, registers
+from r3000.registers import Register
+
+
+class DisassemblyTableModel(QAbstractTableModel):
+    HEADERS = ('Address', 'Encoding', 'Opcode', 'Operands', 'rs', 'rt', 'rd', 'Imm')
+
+    def __init__(self, parent: QObject | None = None):
+        super().__init__(parent)
+        self._words: npt.NDArray[np.uint32] = np.zeros(0, dtype=np.uint32)
+        self._base_address = 0
+        self._context = registers.ExecutionContext()
+        self._cached_row: tuple[int, tuple[str, ...]] | None = None
+
+    def set_words(self, words: npt.NDArray[np.uint32], base_address: int = 0):
+        self.beginResetModel()
+        self._words = words
+        self._base_address = base_address
+        self._cached_row = None
+        self.endResetModel()
+
+    def rowCount(self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._words.size
+
+    def columnCount(self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(
+            self,
+            section: int,
+            orientation: Qt.Orientation,
+            role: int = Qt.ItemDataRole.DisplayRole) -> str | None:
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index: QModelIndex | QPersistentModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> str | None:
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        return self._row_strings(index.row())[index.column()]
+
+    def _row_strings(self, row: int) -> tuple[str, ...]:
+        if self._cached_row is not None and self._cached_row[0] == row:
+            return self._cached_row[1]
+        encoded = int(self._words[row])
+        opcode, args = opcodes.decode(encoded)
+        address = self._base_address + row * 4
+        self._context.pc.value = address
+        row_strings = (
+            f'{address:08X}',
+            f'{encoded:08X}',
+            opcode.name,
+            opcode.args_to_string(self._context, args),
+            self._register_string(args.rs),
+            self._register_string(args.rt),
+            self._register_string(args.rd),
+            opcodes.Helpers.signed_imm_string(args) if args.imm is not None else '')
+        self._cached_row = (row, row_strings)
+        return row_strings
+
+    @staticmethod
+    def _register_string(register: Register | None) -> str:
+        return register.display if register is not None else ''
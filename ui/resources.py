@@ -1,3 +1,4 @@
+import functools
 import os.path
 from PySide6.QtGui import QIcon
 
@@ -10,9 +11,11 @@ class Icons:
     binary_24 = 'binary-24.png'
 
 
+@functools.cache
 def icon_path(icon_name: str) -> str:
     return os.path.join(ICONS_PATH, icon_name)
 
 
+@functools.cache
 def load_icon(icon_name: str) -> QIcon:
     return QIcon(icon_path(icon_name))
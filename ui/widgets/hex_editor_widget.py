@@ -1,13 +1,21 @@
+import collections
 from contextlib import contextmanager
 import dataclasses
+import functools
+import logging
 import typing
 import numpy as np
 import numpy.typing as npt
-from PySide6.QtCore import Qt, QPoint, QRect, QSize, QTimer
+from PySide6.QtCore import Qt, QPoint, QRect, QRectF, QSize, QTimer
 from PySide6.QtGui import QBrush, QColor, QFont, QFontMetrics, QKeyEvent, QMouseEvent, QPainter, QPaintEvent, QPen
+from PySide6.QtGui import QHideEvent, QImage, QPixmap, QRegion, QShowEvent, QStaticText
 from PySide6.QtWidgets import QWidget
 
 
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+
 class HexEditorWidgetPalette:
     def __init__(self):
         self.header_bg = QColor(0xf0, 0xf0, 0xf0)
@@ -19,15 +27,42 @@ class HexEditorWidgetPalette:
         self.selection_data_bg = QColor(0x00, 0x78, 0xd7)
         self.selection_data_fg = QColor(0x00, 0x00, 0x00)
         self.cursor_fg = QColor(0x00, 0x00, 0x00)
+        self.update_brushes_and_pens()
+
+    def update_brushes_and_pens(self):
+        self._header_brush = QBrush(self.header_bg)
+        self._header_pen = QPen(self.header_fg)
+        self._data_cell_brush = QBrush(self.data_cell_bg)
+        self._data_cell_pen = QPen(self.data_cell_fg)
+        self._modified_data_cell_brush = QBrush(self.modified_data_cell_bg)
+        self._modified_data_cell_pen = QPen(self.modified_data_cell_fg)
+        self._selection_data_brush = QBrush(self.selection_data_bg)
+        self._cursor_pen = QPen(self.cursor_fg)
+        self._cursor_pen.setWidth(2)
 
     def header_brush(self) -> QBrush:
-        return QBrush(self.header_bg)
+        return self._header_brush
+
+    def header_pen(self) -> QPen:
+        return self._header_pen
 
     def data_cell_brush(self) -> QBrush:
-        return QBrush(self.data_cell_bg)
+        return self._data_cell_brush
+
+    def data_cell_pen(self) -> QPen:
+        return self._data_cell_pen
 
     def modified_data_cell_brush(self) -> QBrush:
-        return QBrush(self.modified_data_cell_bg)
+        return self._modified_data_cell_brush
+
+    def modified_data_cell_pen(self) -> QPen:
+        return self._modified_data_cell_pen
+
+    def selection_data_brush(self) -> QBrush:
+        return self._selection_data_brush
+
+    def cursor_pen(self) -> QPen:
+        return self._cursor_pen
 
 
 class HexEditorWidget(QWidget):
@@ -48,17 +83,29 @@ class HexEditorWidget(QWidget):
 
     def setFont(self, font: QFont, /):
         super().setFont(font)
+        self._painter.invalidate_static_texts()
         self._metrics.update(QFontMetrics(font))
+        self._painter.invalidate_rows()
 
     def set_data(self, data: npt.NDArray[np.uint8]):
         self._data.update_data_bytes(data)
         self._metrics.update_data_cells()
         # TODO: remove it
-        for i in range(self._data.data_bytes.size):
-            if i % 10 == 0:
-                self._data.data_bytes[i] = self._data.data_bytes[i] + 2
+        np.frombuffer(self._data.data_bytes, dtype=np.uint8)[::10] += 2
+        self._data.mark_modified(slice(None, None, 10))
+        self._painter.invalidate_rows()
         self.update()
 
+    def set_byte(self, index: int, value: int, modified: bool = True):
+        self._data.data_bytes[index] = value
+        if modified:
+            self._data.mark_modified(index)
+        else:
+            self._data.clear_modified(index)
+        row = index // self._data.bytes_per_row
+        self._painter.invalidate_row(row)
+        self.update(self._painter.row_rect(row))
+
     def set_column_bytes_count(self, bytes_count: int, group_size: int = None):
         self.set_groups_per_row(groups_per_row=bytes_count // group_size, group_size=group_size)
 
@@ -81,10 +128,13 @@ class HexEditorWidget(QWidget):
         try:
             yield self._palette
         finally:
+            self._palette.update_brushes_and_pens()
+            self._painter.invalidate_rows()
             self.update()
 
     def _update_metrics(self):
         self._metrics.update(QFontMetrics(self.font()))
+        self._painter.invalidate_rows()
 
     def paintEvent(self, event: QPaintEvent, /):
         super().paintEvent(event)
@@ -135,14 +185,24 @@ class HexEditorWidget(QWidget):
 
     def focusInEvent(self, event, /):
         super().focusInEvent(event)
-        #self._cursor_timer.start()
+        if self.isVisible():
+            self._cursor_timer.start()
 
     def focusOutEvent(self, event, /):
         super().focusOutEvent(event)
         self._cursor_timer.stop()
-        self._data.cursor_visible = False
+        self._data.cursor.visible = False
         self._repaint_cursor()
 
+    def showEvent(self, event: QShowEvent, /):
+        super().showEvent(event)
+        if self.hasFocus():
+            self._cursor_timer.start()
+
+    def hideEvent(self, event: QHideEvent, /):
+        super().hideEvent(event)
+        self._cursor_timer.stop()
+
     def _handle_cursor_mouse_click(self, pos: QPoint):
         if pos.x() < self._metrics.data_cells.left() or pos.x() > self._metrics.data_cells.right():
             return
@@ -161,14 +221,16 @@ class HexEditorWidget(QWidget):
             nibble = 0
         elif nibble >= self._data.nibbles_per_group:
             nibble = self._data.nibbles_per_group
-        print(f"CLICK {row},{group},{nibble}")
+        logger.debug('Click at %d,%d,%d', row, group, nibble)
         # TODO: check for mouse move?
         self._set_cursor_position(self._data.cursor.grid_to_position(row, group, nibble), move_anchor=True)
 
     def _on_cursor_timer_timeout(self):
-        # TODO: update rect with cursor
-        self._data.cursor_visible = not self._data.cursor_visible
-        self.update()
+        if not self.isVisible():
+            self._cursor_timer.stop()
+            return
+        self._data.cursor.visible = not self._data.cursor.visible
+        self._repaint_cursor()
 
     def _h_shift_cursor_index(self, shift: int, move_anchor: bool, force_clamped_shift: bool = False):
         if not force_clamped_shift and not self._data.cursor.can_move_by(shift):
@@ -180,17 +242,17 @@ class HexEditorWidget(QWidget):
         self._h_shift_cursor_index(shift * self._data.cursor.positions_in_row, move_anchor, force_clamped_shift)
 
     def _set_cursor_position(self, new_position: int, move_anchor: bool):
-        print(f"SETTING NEW CURSOR INDEX {new_position}")
+        logger.debug('Setting new cursor index %d', new_position)
         self._data.cursor.move_to(new_position, move_anchor)
         self._on_cursor_index_updated()
 
     def _on_cursor_index_updated(self):
-        self._data.cursor_visible = True
+        self._data.cursor.visible = True
         self._cursor_timer.start()
-        self._repaint_cursor()
+        self.update()
 
     def _repaint_cursor(self):
-        self.update()
+        self.update(self._painter.cursor_rect())
 
 
 class _Cursor:
@@ -199,8 +261,18 @@ class _Cursor:
         self._position: int = 0
         self._anchor_position: int = 0
         self._max_position: int = 0
-        self.positions_in_row: int = 1
+        self._positions_in_row: int = 1
         self.positions_in_group: int = 1
+        self._max_position_in_row: int = 0
+
+    @property
+    def positions_in_row(self) -> int:
+        return self._positions_in_row
+
+    @positions_in_row.setter
+    def positions_in_row(self, positions_in_row: int):
+        self._positions_in_row = positions_in_row
+        self._max_position_in_row = positions_in_row - 1
 
     @property
     def position(self) -> int:
@@ -225,11 +297,11 @@ class _Cursor:
 
     @property
     def max_position_in_row(self) -> int:
-        return self.positions_in_row - 1
+        return self._max_position_in_row
 
     @property
     def current_row(self) -> int:
-        return self.position // self.positions_in_row
+        return self._position // self._positions_in_row
 
     def row_positions(self, row: int) -> tuple[int, int]:
         start_position = self.upper_clamped_position(row * self.positions_in_row)
@@ -237,18 +309,24 @@ class _Cursor:
         return start_position, end_position
 
     def position_to_grid(self, position: int) -> tuple[int, int, int]:
-        row = position // self.positions_in_row
-        in_row_position = position % self.positions_in_row
-        group = in_row_position // self.positions_in_group
-        if in_row_position != self.max_position_in_row:
-            nibble = in_row_position % self.positions_in_group
+        row, in_row_position = divmod(position, self._positions_in_row)
+        if in_row_position != self._max_position_in_row:
+            group, nibble = divmod(in_row_position, self.positions_in_group)
         else:
-            group -= 1
+            group = in_row_position // self.positions_in_group - 1
             nibble = self.positions_in_group
         return row, group, nibble
 
+    def positions_to_grid(self, positions: npt.ArrayLike) -> tuple[npt.NDArray, npt.NDArray, npt.NDArray]:
+        rows, in_row_positions = np.divmod(np.asarray(positions), self._positions_in_row)
+        groups, nibbles = np.divmod(in_row_positions, self.positions_in_group)
+        row_ends = in_row_positions == self._max_position_in_row
+        groups[row_ends] -= 1
+        nibbles[row_ends] = self.positions_in_group
+        return rows, groups, nibbles
+
     def grid_to_position(self, row: int, group: int, nibble: int) -> int:
-        return row * self.positions_in_row + group * self.positions_in_group + nibble
+        return row * self._positions_in_row + group * self.positions_in_group + nibble
 
     def has_selection(self) -> bool:
         return self.position != self._anchor_position
@@ -290,8 +368,9 @@ class _Cursor:
 @dataclasses.dataclass
 class _Data:
     address: int = 0x80000000
-    data_bytes: npt.NDArray[np.uint8] = dataclasses.field(default_factory=lambda: np.empty(0, dtype=np.uint8))
-    original_data_bytes: npt.NDArray[np.uint8] = dataclasses.field(default_factory=lambda: np.empty(0, dtype=np.uint8))
+    data_bytes: bytearray = dataclasses.field(default_factory=bytearray)
+    modified_bits: npt.NDArray[np.uint8] = dataclasses.field(default_factory=lambda: np.empty(0, dtype=np.uint8))
+    modified_groups: npt.NDArray[np.bool_] = dataclasses.field(default_factory=lambda: np.empty(0, dtype=np.bool_))
     groups_per_row: int = 1
     group_size: int = 1
     bytes_per_row: int = 1
@@ -304,24 +383,62 @@ class _Data:
         return self.group_size << 1
 
     def update_data_bytes(self, data_bytes: npt.NDArray[np.uint8]):
-        self.data_bytes = data_bytes.copy()
-        self.original_data_bytes = data_bytes.copy()
+        self.data_bytes = bytearray(data_bytes)
+        self.modified_bits = np.zeros((len(self.data_bytes) + 7) >> 3, dtype=np.uint8)
+        self.update_modified_groups()
         self.update_rows_number()
         self.update_cursor_data()
 
+    def is_modified(self, index: int) -> bool:
+        return bool(self.modified_bits[index >> 3] & (1 << (index & 7)))
+
+    def mark_modified(self, indices: int | slice):
+        if isinstance(indices, slice):
+            self._set_modified_bytes(indices, 1)
+        else:
+            self.modified_bits[indices >> 3] |= 1 << (indices & 7)
+            self.modified_groups[indices // self.group_size] = True
+
+    def clear_modified(self, indices: int | slice):
+        if isinstance(indices, slice):
+            self._set_modified_bytes(indices, 0)
+        else:
+            self.modified_bits[indices >> 3] &= ~(1 << (indices & 7)) & 0xff
+            group_start = indices - indices % self.group_size
+            group_end = min(group_start + self.group_size, len(self.data_bytes))
+            self.modified_groups[indices // self.group_size] = \
+                any(self.is_modified(index) for index in range(group_start, group_end))
+
+    def _set_modified_bytes(self, indices: slice, value: int):
+        modified_bytes = self._unpack_modified_bits()
+        modified_bytes[indices] = value
+        self.modified_bits = np.packbits(modified_bytes, bitorder='little')
+        self.update_modified_groups()
+
+    def _unpack_modified_bits(self) -> npt.NDArray[np.uint8]:
+        return np.unpackbits(self.modified_bits, count=len(self.data_bytes), bitorder='little')
+
+    def update_modified_groups(self):
+        modified_bytes = self._unpack_modified_bits().astype(np.bool_)
+        padding = -modified_bytes.size % self.group_size
+        if padding:
+            modified_bytes = np.concatenate((modified_bytes, np.zeros(padding, dtype=np.bool_)))
+        self.modified_groups = modified_bytes.reshape(-1, self.group_size).any(axis=1)
+
     def update_rows_number(self):
         self.rows_number = \
-            (self.data_bytes.size + self.bytes_per_row - 1) // self.bytes_per_row \
-            if self.data_bytes.size > self.group_size else \
+            (len(self.data_bytes) + self.bytes_per_row - 1) // self.bytes_per_row \
+            if len(self.data_bytes) > self.group_size else \
             1
         self._update_full_rows_number()
 
     def update_bytes_per_row(self):
         self.bytes_per_row = self.groups_per_row * self.group_size
         self._update_full_rows_number()
+        self.update_modified_groups()
 
     def _update_full_rows_number(self):
-        self.full_rows_number = self.data_bytes.size // self.bytes_per_row
+        self.full_rows_number = len(self.data_bytes) // self.bytes_per_row
 
     def update_cursor_data(self):
         max_position = self.full_rows_number * self.cursor.positions_in_row
@@ -330,7 +447,7 @@ class _Data:
         self.cursor.max_position = max_position
 
     def non_full_row_bytes_number(self) -> int:
-        return self.data_bytes.size % self.bytes_per_row
+        return len(self.data_bytes) % self.bytes_per_row
 
     def non_full_row_groups_number(self) -> int:
         return (self.non_full_row_bytes_number() + self.group_size - 1) // self.group_size
@@ -376,12 +493,6 @@ class _CellMetrics:
     def content_position(self) -> QPoint:
         return QPoint(self.padding.left, self.padding.top)
 
-    def rect_xy(self, x: int, y: int) -> QRect:
-        return self.rect_p(QPoint(x, y))
-
-    def rect_p(self, p: QPoint) -> QRect:
-        return QRect(p, self.size)
-
     def content_rect_xy(self, x: int, y: int) -> QRect:
         return self.content_rect_p(QPoint(x, y))
 
@@ -410,6 +521,15 @@ class _Metrics:
         self.row_0 = QRect()
         self.data_cell = self._data_cell_metrics()
         self.data_cells = QRect()
+        self.data_cell_xs: list[int] = []
+        self.data_cell_ys: list[int] = []
+        self.address_strings: list[str] = []
+        self._data_cell_width = 1
+        self._data_cell_height = 1
+        self._nibble_x0 = 0
+        self._nibble_y0 = 0
+        self.nibbles_checker_pixmap = QPixmap()
+        self._nibbles_checker_key: tuple[int, ...] = ()
         self.digit_width = 1
 
     def update(self, font_metrics: QFontMetrics):
@@ -429,8 +549,9 @@ class _Metrics:
                 self.row_header.width + self.group_header.width * self._data.groups_per_row,
                 self.group_header.height))
         self.data_cell = self._data_cell_metrics()
-        self.update_data_cells()
         self.digit_width = font_metrics.horizontalAdvance('0')
+        self.update_data_cells()
+        self._update_nibbles_checker_pixmap()
 
     def update_data_cells(self):
         self.data_cells = QRect(
@@ -438,6 +559,34 @@ class _Metrics:
             QSize(
                 self.group_header.width * self._data.groups_per_row,
                 self.row_header.height * self._data.rows_number))
+        self._data_cell_width = self.data_cell.width
+        self._data_cell_height = self.data_cell.height
+        self._nibble_x0 = self.data_cells.x() + self.data_cell.padding.left
+        self._nibble_y0 = self.data_cells.y() + self.data_cell.padding.top
+        self.data_cell_xs = (self.data_cells.x() + np.arange(self._data.groups_per_row) * self.data_cell.width).tolist()
+        self.data_cell_ys = (self.data_cells.y() + np.arange(self._data.rows_number) * self.data_cell.height).tolist()
+        self.address_strings = [
+            f'{self._data.address + row * self._data.bytes_per_row:08x}' for row in range(self._data.rows_number)]
+
+    def _update_nibbles_checker_pixmap(self):
+        key = (self.data_cell.width, self.data_cell.height, self.digit_width, self._data.nibbles_per_group)
+        if key == self._nibbles_checker_key:
+            return
+        self._nibbles_checker_key = key
+        pixmap = QPixmap(self.data_cell.width * 2, self.data_cell.height * 2)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        origin = self.first_data_cell_position()
+        painter = QPainter(pixmap)
+        for row in range(2):
+            for group in range(2):
+                for nibble in range(self._data.nibbles_per_group):
+                    nibble_rect = QRect(
+                        self.data_cell_nibble_top_left(row, group, nibble) - origin,
+                        self.data_cell_nibble_bottom_right(row, group, nibble) - origin)
+                    nibble_bg = _EVEN_NIBBLE_BG if (row + group + nibble) % 2 == 0 else _ODD_NIBBLE_BG
+                    painter.fillRect(nibble_rect, nibble_bg)
+        painter.end()
+        self.nibbles_checker_pixmap = pixmap
 
     def _data_cell_metrics(self) -> _CellMetrics:
         metrics = _CellMetrics(self._data_cell_padding())
@@ -453,30 +602,24 @@ class _Metrics:
     def first_data_cell_position(self) -> QPoint:
         return QPoint(self.row_header.width, self.group_header.height)
 
-    def data_cell_rect(self, row: int, group: int) -> QRect:
-        return self.data_cell.rect_p(self.first_data_cell_position() + self.data_cell_offset(row, group))
-
-    def data_cell_inner_rect(self, row: int, group: int) -> QRect:
-        return self.data_cell.content_rect_p(self.first_data_cell_position() + self.data_cell_offset(row, group))
-
-    def data_cell_offset(self, row: int, group: int) -> QPoint:
-        return QPoint(group * self.data_cell.width, row * self.data_cell.height)
-
-    def data_cell_position(self, row: int, group: int) -> QPoint:
-        return self.first_data_cell_position() + self.data_cell_offset(row, group)
-
     def data_cell_nibble_top_left(self, row: int, group: int, nibble: int) -> QPoint:
-        return self.first_data_cell_position() + self.data_cell_offset(row, group) + \
-            self.data_cell.content_position + QPoint(self.digit_width * nibble, 0)
+        return QPoint(
+            self._nibble_x0 + group * self._data_cell_width + nibble * self.digit_width,
+            self._nibble_y0 + row * self._data_cell_height)
 
     def data_cell_nibble_bottom_right(self, row: int, group: int, nibble: int) -> QPoint:
-        return self.data_cell_nibble_top_left(row, group, nibble) + QPoint(self.digit_width, self.font_height)
+        return QPoint(
+            self._nibble_x0 + group * self._data_cell_width + (nibble + 1) * self.digit_width,
+            self._nibble_y0 + row * self._data_cell_height + self.font_height)
 
     def _text_size(self, width: int) -> QSize:
         return QSize(width, self.font_height)
 
 
 _ALIGN_LEFT_VCENTER = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+_EVEN_NIBBLE_BG = QColor(0xff, 0xff, 0x00)
+_ODD_NIBBLE_BG = QColor(0x00, 0xff, 0x00)
+_ROW_PIXMAPS_CACHE_SIZE = 256
 
 
 class _Painter:
@@ -485,60 +628,156 @@ class _Painter:
         self.metrics = metrics
         self._painter: typing.Optional[QPainter] = None
         self._event: typing.Optional[QPaintEvent] = None
+        self._dirty_rect = QRect()
         self._palette: typing.Optional[HexEditorWidgetPalette] = None
+        self._row_pixmaps: collections.OrderedDict[int, QPixmap] = collections.OrderedDict()
+        self._back_buffer = QImage()
+        self._back_buffer_rect = QRect()
+        self._back_buffer_key: tuple = ()
+        self._back_buffer_valid_region = QRegion()
+        self._static_text = functools.lru_cache(maxsize=4096)(self._create_static_text)
+
+    def invalidate_static_texts(self):
+        self._static_text.cache_clear()
+
+    def invalidate_rows(self):
+        self._row_pixmaps.clear()
+        self.invalidate_back_buffer()
+
+    def invalidate_row(self, row: int):
+        self._row_pixmaps.pop(row, None)
+        self._back_buffer_valid_region = self._back_buffer_valid_region.subtracted(self.row_rect(row))
+
+    def row_rect(self, row: int) -> QRect:
+        return QRect(0, self.metrics.data_cell_ys[row], self.metrics.row_0.width(), self.metrics.data_cell.height)
+
+    def invalidate_back_buffer(self):
+        self._back_buffer_valid_region = QRegion()
 
     def paint(self, painter: QPainter, event: QPaintEvent, palette: HexEditorWidgetPalette):
-        self._painter = painter
         self._event = event
         self._palette = palette
-        self._paint_group_headers()
-        self._paint_address_headers()
-        self._paint_data_bg()
-        self._paint_data()
+        self._update_back_buffer_size(painter)
+        dirty_rect = event.rect().intersected(self._back_buffer_rect)
+        if not dirty_rect.isEmpty():
+            self._update_back_buffer(painter, palette, dirty_rect)
+            pixel_ratio = self._back_buffer.devicePixelRatio()
+            painter.drawImage(
+                QRectF(dirty_rect),
+                self._back_buffer,
+                QRectF(
+                    dirty_rect.x() * pixel_ratio, dirty_rect.y() * pixel_ratio,
+                    dirty_rect.width() * pixel_ratio, dirty_rect.height() * pixel_ratio))
+        self._painter = painter
+        self._dirty_rect = dirty_rect
+        self._paint_selection()
         self._paint_cursor()
         self._painter = None
         self._event = None
         self._palette = None
 
+    def _update_back_buffer_size(self, painter: QPainter):
+        device = painter.device()
+        size = QSize(device.width(), device.height()).boundedTo(QSize(
+            self.metrics.row_0.width(), self.metrics.data_cells.y() + self.metrics.data_cells.height()))
+        pixel_ratio = device.devicePixelRatioF()
+        key = (size.width(), size.height(), pixel_ratio)
+        if key == self._back_buffer_key:
+            return
+        self._back_buffer_key = key
+        self._back_buffer_rect = QRect(QPoint(0, 0), size)
+        self._back_buffer = QImage(
+            round(size.width() * pixel_ratio),
+            round(size.height() * pixel_ratio),
+            QImage.Format.Format_ARGB32_Premultiplied)
+        self._back_buffer.setDevicePixelRatio(pixel_ratio)
+        self.invalidate_back_buffer()
+
+    def _update_back_buffer(self, painter: QPainter, palette: HexEditorWidgetPalette, dirty_rect: QRect):
+        invalid_region = QRegion(dirty_rect).subtracted(self._back_buffer_valid_region)
+        if invalid_region.isEmpty():
+            return
+        self._dirty_rect = invalid_region.boundingRect()
+        self._painter = QPainter(self._back_buffer)
+        self._painter.setRenderHint(QPainter.RenderHint.Antialiasing, False)
+        self._painter.setFont(painter.font())
+        self._painter.setClipRect(self._dirty_rect)
+        self._painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
+        self._painter.fillRect(self._dirty_rect, Qt.GlobalColor.transparent)
+        self._painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceOver)
+        self._paint_group_headers()
+        self._paint_address_headers()
+        self._paint_data_bg()
+        self._paint_data(self._painter, palette, self._dirty_rect)
+        self._painter.end()
+        self._painter = None
+        self._back_buffer_valid_region = self._back_buffer_valid_region.united(self._dirty_rect)
+
+    def cursor_rect(self) -> QRect:
+        cursor_position = self._cursor_xy_position(self.data.cursor.position)
+        return QRect(cursor_position.x() - 2, cursor_position.y() - 1, 4, self.metrics.font_height + 3)
+
+    def selection_rects(self, start_position: int, end_position: int) -> list[QRect]:
+        rows, groups, nibbles = self.data.cursor.positions_to_grid((start_position, end_position))
+        (start_row, end_row), (start_group, end_group), (start_nibble, end_nibble) = \
+            rows.tolist(), groups.tolist(), nibbles.tolist()
+        top_left = self.metrics.data_cell_nibble_top_left
+        bottom_right = self.metrics.data_cell_nibble_bottom_right
+        if start_row == end_row:
+            return [QRect(top_left(start_row, start_group, start_nibble), bottom_right(end_row, end_group, end_nibble))]
+        last_group = self.data.groups_per_row - 1
+        last_nibble = self.data.nibbles_per_group - 1
+        rects = [
+            QRect(top_left(start_row, start_group, start_nibble), bottom_right(start_row, last_group, last_nibble))]
+        if end_row - start_row > 1:
+            rects.append(QRect(top_left(start_row + 1, 0, 0), bottom_right(end_row - 1, last_group, last_nibble)))
+        rects.append(QRect(top_left(end_row, 0, 0), bottom_right(end_row, end_group, end_nibble)))
+        return rects
+
+    def _rows_in(self, rect: QRect) -> range:
+        first_row_y = self.metrics.data_cells.top()
+        row_height = self.metrics.data_cell.height
+        first_row = max(0, (rect.top() - first_row_y) // row_height)
+        last_row = min(self.data.rows_number - 1, (rect.bottom() - first_row_y) // row_height)
+        return range(first_row, last_row + 1)
+
     def _paint_address_headers(self):
-        header_rect = self.metrics.row_header.rect_xy(0, self.metrics.group_header.height)
+        visible_rows = self._rows_in(self._dirty_rect)
+        if not visible_rows:
+            return
+        header_width = self.metrics.row_header.width
         header_height = self.metrics.row_header.height
         bg_brush = self._palette.header_brush()
-        self._painter.setPen(self._header_text_pen())
-        address = self.data.address
-        for row in range(self.data.rows_number):
+        self._painter.setPen(self._palette.header_pen())
+        for y, address_string in zip(
+                self.metrics.data_cell_ys[visible_rows.start:visible_rows.stop],
+                self.metrics.address_strings[visible_rows.start:visible_rows.stop]):
+            header_rect = QRect(0, y, header_width, header_height)
             self._painter.fillRect(header_rect, bg_brush)
-            self._painter.drawText(header_rect, Qt.AlignmentFlag.AlignCenter, f'{address:08x}')
-            address += self.data.bytes_per_row
-            header_rect.adjust(0, header_height, 0, header_height)
+            self._painter.drawText(header_rect, Qt.AlignmentFlag.AlignCenter, address_string)
 
     def _paint_group_headers(self):
+        if not self._dirty_rect.intersects(self.metrics.row_0):
+            return
         header_rect = self.metrics.group_header.content_rect_xy(self.metrics.row_header.width, 0)
         header_width = self.metrics.group_header.width
         self._painter.fillRect(self.metrics.row_0, self._palette.header_brush())
-        self._painter.setPen(self._header_text_pen())
+        self._painter.setPen(self._palette.header_pen())
         for offset in range(0, self.data.bytes_per_row, self.data.group_size):
             self._painter.drawText(header_rect, _ALIGN_LEFT_VCENTER, f'+{offset:x}')
             header_rect.adjust(header_width, 0, header_width, 0)
 
     def _paint_data_bg(self):
-        self._painter.fillRect(self.metrics.data_cells, self._palette.data_cell_brush())
-        start = self.metrics.data_cell_nibble_top_left(1, group=0, nibble=1)
-        end = self.metrics.data_cell_nibble_bottom_right(1, group=0, nibble=1)
-        #self._painter.fillRect(QRect(start, end), QColor(0xff, 0xff, 0x00))
-
-
-        for row in range(self.data.rows_number):
-            for group in range(self.data.groups_per_row):
-                for nibble in range(self.data.nibbles_per_group):
-                    start = self.metrics.data_cell_nibble_top_left(row, group, nibble)
-                    end = self.metrics.data_cell_nibble_bottom_right(row, group, nibble)
-                    disc = row + group + nibble
-                    self._painter.fillRect(QRect(start, end), (QColor(255, 255, 0) if disc % 2 == 0 else QColor(0, 255, 0)))
-
-
-
+        data_cells_rect = self.metrics.data_cells.intersected(self._dirty_rect)
+        if data_cells_rect.isEmpty():
+            return
+        self._painter.fillRect(data_cells_rect, self._palette.data_cell_brush())
+        self._painter.drawTiledPixmap(
+            data_cells_rect,
+            self.metrics.nibbles_checker_pixmap,
+            data_cells_rect.topLeft() - self.metrics.data_cells.topLeft())
 
+    def _paint_selection(self):
         if not self.data.cursor.has_selection():
             return
         cursor = self.data.cursor
@@ -548,90 +787,87 @@ class _Painter:
         else:
             start_position = cursor.position
             end_position = cursor.anchor_position
-        end_position -= 1
-        start_row, start_group, start_nibble = cursor.position_to_grid(start_position)
-        end_row, end_group, end_nibble = cursor.position_to_grid(end_position)
-        start_position = self.metrics.data_cell_nibble_top_left(start_row, start_group, start_nibble)
-        end_position = self.metrics.data_cell_nibble_bottom_right(end_row, end_group, end_nibble)
-        self._painter.fillRect(QRect(start_position, end_position), self._palette.selection_data_bg)
-
-
-    def _paint_data(self):
-        data_pen = QPen(self._palette.data_cell_fg)
-        modified_data_brush = self._palette.modified_data_cell_brush()
-        modified_data_pen = QPen(self._palette.modified_data_cell_fg)
-        self._painter.setPen(data_pen)
-        is_data_pen_in_use = True
-        # TODO: add selection fg pen
-
-        temp = 0
-
-        def draw_cell(rect: QRect, inner_rect: QRect):
-            nonlocal is_data_pen_in_use
-            data_bytes = self.data.data_bytes[data_index:data_index + self.data.group_size]
-            original_data_bytes = self.data.original_data_bytes[data_index:data_index + self.data.group_size]
-            if np.array_equal(data_bytes, original_data_bytes):
-                if not is_data_pen_in_use:
-                    self._painter.setPen(data_pen)
-                    is_data_pen_in_use = True
+        selection = QRegion()
+        for rect in self.selection_rects(start_position, end_position - 1):
+            selection = selection.united(rect)
+        selection = selection.intersected(self._dirty_rect)
+        if selection.isEmpty():
+            return
+        selection_rect = selection.boundingRect()
+        self._painter.save()
+        self._painter.setClipRegion(selection, Qt.ClipOperation.IntersectClip)
+        self._painter.fillRect(selection_rect, self._palette.selection_data_brush())
+        self._paint_data(self._painter, self._palette, selection_rect)
+        self._painter.restore()
+
+    def _paint_data(self, painter: QPainter, palette: HexEditorWidgetPalette, rect: QRect):
+        data_cells_x = self.metrics.data_cells.x()
+        for row in self._rows_in(rect):
+            row_pixmap = self._row_pixmaps.get(row)
+            if row_pixmap is None:
+                row_pixmap = self._row_pixmaps[row] = self._render_row(row, painter, palette)
+                if len(self._row_pixmaps) > _ROW_PIXMAPS_CACHE_SIZE:
+                    self._row_pixmaps.popitem(last=False)
             else:
-                if is_data_pen_in_use:
-                    self._painter.setPen(modified_data_pen)
-                    is_data_pen_in_use = False
-                #if not selected:
-                #    self._painter.fillRect(rect, modified_data_brush)
-            data_text = ''.join(f'{b:02x}' for b in data_bytes)
-            #self._painter.drawText(inner_rect, _ALIGN_LEFT_VCENTER, data_text)
-            nonlocal temp
-            #self._painter.fillRect(rect, QColor(0xff, 0x00, 0x00) if temp % 3 == 0 else QColor(0x00, 0xff, 0x00))
-            temp += 1
-            self._painter.drawText(inner_rect, _ALIGN_LEFT_VCENTER, data_text)
-
-        cell_width = self.metrics.data_cell.width
-        cell_height = self.metrics.data_cell.height
-        row_first_group_rect = self.metrics.data_cell_rect(row=0, group=0)
-        row_first_group_inner_rect = self.metrics.data_cell_inner_rect(row=0, group=0)
-        data_index = 0
-        for row in range(self.data.full_rows_number):
-            cell_rect = QRect(row_first_group_rect)
-            cell_inner_rect = QRect(row_first_group_inner_rect)
-            for column_index in range(self.data.groups_per_row):
-                draw_cell(cell_rect, cell_inner_rect)
-                cell_rect.adjust(cell_width, 0, cell_width, 0)
-                cell_inner_rect.adjust(cell_width, 0, cell_width, 0)
-                data_index += self.data.group_size
-            row_first_group_rect.adjust(0, cell_height, 0, cell_height)
-            row_first_group_inner_rect.adjust(0, cell_height, 0, cell_height)
-        if self.data.rows_number > self.data.full_rows_number:
-            cell_rect = row_first_group_rect
-            cell_inner_rect = row_first_group_inner_rect
-            for column_index in range(self.data.non_full_row_groups_number()):
-                draw_cell(cell_rect, cell_inner_rect)
-                cell_rect.adjust(cell_width, 0, cell_width, 0)
-                cell_inner_rect.adjust(cell_width, 0, cell_width, 0)
-                data_index += self.data.group_size
+                self._row_pixmaps.move_to_end(row)
+            painter.drawPixmap(data_cells_x, self.metrics.data_cell_ys[row], row_pixmap)
+
+    def _render_row(self, row: int, painter: QPainter, palette: HexEditorWidgetPalette) -> QPixmap:
+        # TODO: add selection fg pen
+        data_cells: list[tuple[QPoint, QStaticText]] = []
+        modified_data_cells: list[tuple[QPoint, QStaticText]] = []
+        data_bytes = self.data.data_bytes
+        modified_groups = self.data.modified_groups
+        group_size = self.data.group_size
+        groups_number = \
+            self.data.groups_per_row \
+            if row < self.data.full_rows_number else \
+            self.data.non_full_row_groups_number()
+        padding = self.metrics.data_cell.padding
+        data_cells_x = self.metrics.data_cells.x()
+        data_index = row * self.data.bytes_per_row
+        for x in self.metrics.data_cell_xs[:groups_number]:
+            cells = modified_data_cells if modified_groups[data_index // group_size] else data_cells
+            cells.append((
+                QPoint(x - data_cells_x + padding.left, padding.top),
+                self._static_text(data_bytes[data_index:data_index + group_size].hex())))
+            data_index += group_size
+        pixel_ratio = painter.device().devicePixelRatioF()
+        pixmap = QPixmap(
+            round(self.metrics.data_cells.width() * pixel_ratio),
+            round(self.metrics.data_cell.height * pixel_ratio))
+        pixmap.setDevicePixelRatio(pixel_ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        pixmap_painter = QPainter(pixmap)
+        pixmap_painter.setFont(painter.font())
+        for pen, cells in (
+                (palette.data_cell_pen(), data_cells),
+                (palette.modified_data_cell_pen(), modified_data_cells)):
+            if not cells:
+                continue
+            pixmap_painter.setPen(pen)
+            for text_position, data_text in cells:
+                pixmap_painter.drawStaticText(text_position, data_text)
+        pixmap_painter.end()
+        return pixmap
+
+    @staticmethod
+    def _create_static_text(text: str) -> QStaticText:
+        static_text = QStaticText(text)
+        static_text.setTextFormat(Qt.TextFormat.PlainText)
+        return static_text
 
     def _paint_cursor(self):
         if not self.data.cursor.visible:
             return
-        pen = QPen(self._palette.cursor_fg)
-        pen.setWidth(2)
-        self._painter.setPen(pen)
+        self._painter.setPen(self._palette.cursor_pen())
         cursor_position = self._cursor_xy_position(self.data.cursor.position)
         self._painter.drawLine(
             cursor_position.x(), cursor_position.y(),
             cursor_position.x(), cursor_position.y() + self.metrics.font_height)
 
     def _cursor_xy_position(self, index_position: int) -> QPoint:
-        row, group, nibble = self.data.cursor.position_to_grid(index_position)
-        xy_position = self.metrics.data_cell_position(row, group)
-        xy_position += QPoint(self.metrics.data_cell.padding.left, self.metrics.data_cell.padding.top)
-        if nibble > 0:
-            xy_position += QPoint(nibble * self.metrics.digit_width, 0)
-        return xy_position
-
-    def _header_text_pen(self) -> QPen:
-        return QPen(self._palette.header_fg)
+        return self.metrics.data_cell_nibble_top_left(*self.data.cursor.position_to_grid(index_position))
 
 
 if __name__ == '__main__':